@@ -0,0 +1,54 @@
+"""Times `Die.keep_highest()` against summing a slice of a `Pool`.
+
+Each case runs in a fresh process so that neither path benefits from caches
+filled by the other.
+"""
+
+import subprocess
+import sys
+
+cases = [
+    # (sides, rolls, keep)
+    (6, 4, 3),
+    (20, 2, 1),
+    (10, 8, 3),
+    (6, 100, 3),
+    (10, 30, 15),
+    (20, 20, 10),
+    (20, 40, 20),
+    (6, 100, 50),
+    (100, 20, 10),
+]
+
+script = '''
+import sys
+import time
+import icepool
+
+sides, rolls, keep, method = sys.argv[1:]
+sides, rolls, keep = int(sides), int(rolls), int(keep)
+die = icepool.d(sides)
+start = time.perf_counter()
+if method == 'keep':
+    die.keep_highest(rolls, keep, 1)
+else:
+    die.pool(rolls)[rolls - keep - 1:rolls - 1].sum()
+print(time.perf_counter() - start)
+'''
+
+
+def run(*args) -> float:
+    output = subprocess.run([sys.executable, '-c', script] +
+                            [str(arg) for arg in args],
+                            capture_output=True,
+                            text=True,
+                            check=True).stdout
+    return float(output) * 1000.0
+
+
+print('| Die | Rolls | Keep | keep_highest (ms) | Pool (ms) |')
+print('|----:|------:|-----:|------------------:|----------:|')
+for sides, rolls, keep in cases:
+    keep_ms = run(sides, rolls, keep, 'keep')
+    pool_ms = run(sides, rolls, keep, 'pool')
+    print(f'| d{sides} | {rolls} | {keep} | {keep_ms:.1f} | {pool_ms:.1f} |')
@@ -45,9 +45,11 @@ Operation in specific cases:
 # Expose certain names at top-level.
 
 from icepool.die.func import (standard, d, __getattr__, bernoulli, coin,
-                              one_hot, from_cumulative_quantities, from_rv,
+                              one_hot, multinomial,
+                              from_cumulative_quantities, from_rv,
                               min_outcome, max_outcome, align, align_range,
-                              reduce, accumulate, apply, apply_sorted)
+                              reduce, accumulate, apply, apply_sorted,
+                              memoize)
 
 from icepool.population import Population
 from icepool.die.die import implicit_convert_to_die, Die
@@ -74,11 +76,11 @@ from icepool.deal import Deal
 from icepool.suits import SuitGenerator
 
 __all__ = [
-    'standard', 'd', 'bernoulli', 'coin', 'one_hot', 'Die', 'Population',
+    'standard', 'd', 'bernoulli', 'coin', 'one_hot', 'multinomial', 'Die', 'Population',
     'Again', 'CountsKeysView', 'CountsValuesView', 'CountsItemsView',
     'from_cumulative_quantities', 'from_rv', 'align', 'align_range', 'lowest',
     'highest', 'min_outcome', 'max_outcome', 'reduce', 'accumulate', 'apply',
-    'apply_sorted', 'Reroll', 'Unlimited', 'OutcomeCountGenerator', 'Pool',
+    'apply_sorted', 'memoize', 'Reroll', 'Unlimited', 'OutcomeCountGenerator', 'Pool',
     'standard_pool', 'OutcomeCountEvaluator', 'Order', 'JointEvaluator',
     'SumEvaluator', 'Deck', 'Deal', 'SuitGenerator', 'clear_pool_cache'
 ]
@@ -8,14 +8,54 @@ import math
 from typing import Any, Collection, ItemsView, Iterator, KeysView, Mapping, MutableMapping, Sequence, ValuesView
 
 
+_HASH_MODULUS = (1 << 61) - 1
+"""Modulus for the rolling hash of `Counts`."""
+
+_HASH_BASE = 1_000_003
+"""Base for the rolling hash of `Counts`."""
+
+
+class _CountsStorage():
+    """Sorted keys and values shared between a `Counts` and its slices."""
+
+    keys: tuple
+    values: tuple[int, ...]
+    index: Mapping[Any, int]
+    """Maps each key to its position in `keys`."""
+
+    def __init__(self, keys: tuple, values: tuple[int, ...]):
+        self.keys = keys
+        self.values = values
+        self.index = {key: i for i, key in enumerate(keys)}
+
+    @cached_property
+    def prefix_hashes(self) -> tuple[list[int], list[int]]:
+        """Rolling hashes of each prefix of the items, and powers of the base.
+
+        This allows the hash of any contiguous slice to be computed in O(1).
+        """
+        hashes = [0]
+        powers = [1]
+        for item in zip(self.keys, self.values):
+            hashes.append((hashes[-1] * _HASH_BASE + hash(item)) %
+                          _HASH_MODULUS)
+            powers.append(powers[-1] * _HASH_BASE % _HASH_MODULUS)
+        return hashes, powers
+
+
 class Counts(Mapping[Any, int]):
     """Immutable dictionary with sorted keys and `int` values.
 
     The values of keys(), values(), and items() are also Sequences, which means
     they can be indexed.
+
+    Internally, this is a contiguous slice of a sorted storage. Removing the
+    min or max key produces a new slice sharing the same storage in O(1).
     """
 
-    _mapping: Mapping[Any, int]
+    _storage: _CountsStorage
+    _start: int
+    _stop: int
 
     def __init__(self, items: Collection[tuple[Any, int]]):
         """
@@ -40,7 +80,55 @@ class Counts(Mapping[Any, int]):
                 mapping[key] = value
             else:
                 mapping[key] += value
-        self._mapping = mapping
+        self._storage = _CountsStorage(tuple(mapping.keys()),
+                                       tuple(mapping.values()))
+        self._start = 0
+        self._stop = len(mapping)
+
+    @classmethod
+    def _new_slice(cls, storage: _CountsStorage, start: int,
+                   stop: int) -> 'Counts':
+        """Creates a `Counts` viewing `storage[start:stop]` without copying."""
+        self = super().__new__(cls)
+        self._storage = storage
+        self._start = start
+        self._stop = stop
+        return self
+
+    @classmethod
+    def _new_sorted(cls, items: Sequence[tuple[Any, int]]) -> 'Counts':
+        """Creates a `Counts` from already-processed items.
+
+        This skips the sorting and validation performed by the constructor.
+
+        Args:
+            items: Key, value pairs with unique, valid keys in sorted order
+                and `int` values.
+        """
+        keys = tuple(key for key, _ in items)
+        values = tuple(value for _, value in items)
+        return cls._new_slice(_CountsStorage(keys, values), 0, len(keys))
+
+    def _slice(self, start: int | None, stop: int | None) -> 'Counts':
+        """A `Counts` with the items in positions `[start:stop]`.
+
+        This shares storage with `self`, unless the slice holds less than half
+        of the storage, in which case it is copied so that the rest of the
+        storage can be freed.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        stop = max(start, stop)
+        if 2 * (stop - start) < len(self._storage.keys):
+            return Counts._new_sorted(self._items[start:stop])
+        return Counts._new_slice(self._storage, self._start + start,
+                                 self._start + stop)
+
+    def _position(self, key) -> int | None:
+        """The position of `key` in the storage, or `None` if not present."""
+        position = self._storage.index.get(key)
+        if position is None or not self._start <= position < self._stop:
+            return None
+        return position
 
     @cached_property
     def _has_zero_values(self):
@@ -51,72 +139,104 @@ class Counts(Mapping[Any, int]):
         return self._has_zero_values
 
     def __len__(self) -> int:
-        return len(self._mapping)
+        return self._stop - self._start
 
     def __contains__(self, key) -> bool:
-        return key in self._mapping
+        return self._position(key) is not None
 
     def __getitem__(self, key) -> int:
-        return self._mapping[key]
+        position = self._position(key)
+        if position is None:
+            raise KeyError(key)
+        return self._storage.values[position]
 
     def __iter__(self) -> Iterator:
-        return iter(self._mapping)
+        return map(self._storage.keys.__getitem__,
+                   range(self._start, self._stop))
 
     @cached_property
     def _keys(self):
-        return tuple(self._mapping.keys())
+        return self._storage.keys[self._start:self._stop]
 
     def keys(self) -> 'CountsKeysView':
         return CountsKeysView(self)
 
     @cached_property
     def _values(self):
-        return tuple(self._mapping.values())
+        return self._storage.values[self._start:self._stop]
 
     def values(self) -> 'CountsValuesView':
         return CountsValuesView(self)
 
     @cached_property
     def _items(self):
-        return tuple(self._mapping.items())
+        return tuple(zip(self._keys, self._values))
 
     def items(self) -> 'CountsItemsView':
         return CountsItemsView(self)
 
+    def _index(self, data: tuple, index):
+        """Indexes into `data`, which is either `_storage.keys` or `_storage.values`.
+
+        Integer indexes are resolved in O(1) without materializing the slice.
+        """
+        if isinstance(index, slice):
+            return data[self._start:self._stop][index]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError('Counts index out of range.')
+        return data[self._start + index]
+
     def __str__(self) -> str:
-        return str(self._mapping)
+        return str(dict(self._items))
 
     def __repr__(self) -> str:
-        return type(self).__qualname__ + f'({repr(self._mapping)})'
+        return type(self).__qualname__ + f'({repr(dict(self._items))})'
+
+    def __reduce__(self):
+        # Rebuild from the items so that no hash state, which depends on
+        # `PYTHONHASHSEED`, is carried between processes.
+        return type(self)._new_sorted, (self._items, )
 
     def __eq__(self, other) -> bool:
         if isinstance(other, Counts):
+            if self._storage is other._storage and (
+                    self._start, self._stop) == (other._start, other._stop):
+                return True
+            if len(self) != len(other) or hash(self) != hash(other):
+                return False
             return self._items == other._items
         else:
             return super().__eq__(other)
 
     @cached_property
     def _hash(self) -> int:
-        return hash(self._items)
+        hashes, powers = self._storage.prefix_hashes
+        return (hashes[self._stop] - hashes[self._start] *
+                powers[len(self)]) % _HASH_MODULUS
 
     def __hash__(self) -> int:
         return self._hash
 
-    @cached_property
-    def _remove_min(self) -> 'Counts':
-        return Counts(self.items()[1:])
-
     def remove_min(self) -> 'Counts':
-        """A `Counts` with the min element removed."""
-        return self._remove_min
+        """A `Counts` with the min element removed.
 
-    @cached_property
-    def _remove_max(self) -> 'Counts':
-        return Counts(self.items()[:-1])
+        This shares storage with `self`.
+        """
+        if not self:
+            raise IndexError('Cannot remove from an empty Counts.')
+        return Counts._new_slice(self._storage, self._start + 1, self._stop)
 
     def remove_max(self) -> 'Counts':
-        """A `Counts` with the max element removed."""
-        return self._remove_max
+        """A `Counts` with the max element removed.
+
+        This shares storage with `self`.
+        """
+        if not self:
+            raise IndexError('Cannot remove from an empty Counts.')
+        return Counts._new_slice(self._storage, self._start, self._stop - 1)
 
     def simplify(self) -> 'Counts':
         """Divides all counts by their greatest common denominator."""
@@ -124,7 +244,7 @@ class Counts(Mapping[Any, int]):
         if gcd <= 1:
             return self
         data = [(outcome, value // gcd) for outcome, value in self.items()]
-        return Counts(data)
+        return Counts._new_sorted(data)
 
 
 class CountsKeysView(KeysView, Sequence):
@@ -134,7 +254,7 @@ class CountsKeysView(KeysView, Sequence):
         self._mapping = counts
 
     def __getitem__(self, index):
-        return self._mapping._keys[index]
+        return self._mapping._index(self._mapping._storage.keys, index)
 
     def __len__(self):
         return len(self._mapping)
@@ -150,7 +270,10 @@ class CountsValuesView(ValuesView[int], Sequence[int]):
         self._mapping = counts
 
     def __getitem__(self, index):
-        return self._mapping._values[index]
+        return self._mapping._index(self._mapping._storage.values, index)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._mapping._values)
 
     def __len__(self) -> int:
         return len(self._mapping)
@@ -168,5 +291,8 @@ class CountsItemsView(ItemsView[Any, int], Sequence[tuple[Any, int]]):
     def __getitem__(self, index):
         return self._mapping._items[index]
 
+    def __iter__(self) -> Iterator[tuple[Any, int]]:
+        return iter(self._mapping._items)
+
     def __eq__(self, other):
         return self._mapping._items == other
@@ -3,10 +3,14 @@ __docformat__ = 'google'
 import icepool
 from icepool.counts import CountsKeysView
 from icepool.outcome_count_generator import NextOutcomeCountGenerator, OutcomeCountGenerator
-from icepool.math import iter_hypergeom
+from icepool.math import deal_splits
 
+from collections import Counter
 from functools import cached_property
-import math
+
+
+_SAMPLE_CHUNK_ELEMENTS = 1 << 22
+"""The approximate maximum number of cards to shuffle at once in `Deal.sample_array()`."""
 
 
 class Deal(OutcomeCountGenerator):
@@ -67,9 +71,7 @@ class Deal(OutcomeCountGenerator):
     def _denomiator(self) -> int:
         d_total = icepool.math.comb(self.deck().size(),
                                     self.total_cards_dealt())
-        d_split = math.prod(
-            icepool.math.comb(self.total_cards_dealt(), h)
-            for h in self.hand_sizes()[1:])
+        d_split = icepool.math.multinomial(*self.hand_sizes())
         return d_total * d_split
 
     def denominator(self) -> int:
@@ -80,17 +82,12 @@ class Deal(OutcomeCountGenerator):
         """Common implementation for _generate_min and _generate_max."""
         min_count = max(
             0, deck_count + self.total_cards_dealt() - self.deck().size())
-        max_count = min(deck_count, self.total_cards_dealt())
-        for count_total in range(min_count, max_count + 1):
-            weight_total = icepool.math.comb(deck_count, count_total)
-            # The "deck" is the hand sizes.
-            for counts, weight_split in iter_hypergeom(self.hand_sizes(),
-                                                       count_total):
-                popped_deal = Deal(
-                    popped_deck,
-                    *(h - c for h, c in zip(self.hand_sizes(), counts)))
-                weight = weight_total * weight_split
-                yield popped_deal, counts, weight
+        for counts, weight in deal_splits(self.hand_sizes(), deck_count,
+                                          min_count):
+            popped_deal = Deal(
+                popped_deck,
+                *(h - c for h, c in zip(self.hand_sizes(), counts)))
+            yield popped_deal, counts, weight
 
     def _generate_min(self, min_outcome) -> NextOutcomeCountGenerator:
         if not self.outcomes() or min_outcome != self.min_outcome():
@@ -110,10 +107,117 @@ class Deal(OutcomeCountGenerator):
 
         yield from self._generate_common(popped_deck, deck_count)
 
+    @cached_property
+    def _transition_count(self) -> int:
+        """The number of transitions between `Deal`s over a full evaluation.
+
+        See `icepool.math.deal_transition_count()`.
+        """
+        return icepool.math.deal_transition_count(
+            tuple(self.deck().values()), tuple(sorted(self.hand_sizes())))
+
     def _estimate_order_costs(self) -> tuple[int, int]:
-        result = len(self.outcomes()) * math.prod(self.hand_sizes())
+        # The transitions when popping from the max side are the mirror image
+        # of those when popping from the min side, since the number of ways
+        # to deal some cards is the same as the number of ways to leave
+        # the complement undealt. So the costs are always equal, and the
+        # direction is decided by the other generators.
+        result = self._transition_count
         return result, result
 
+    def _estimate_sample_order_costs(self) -> tuple[int, int]:
+        # As above, both directions cost the same, so there is no need to
+        # count the transitions for every popped `Deal` while sampling.
+        return 1, 1
+
+    def sample_array(self, n: int, /, *, rng=None) -> tuple:
+        """EXPERIMENTAL: Draws `n` independent random deals as arrays.
+
+        This requires `numpy`. The deck is encoded as an array of outcome
+        indexes, and `n` copies of it are shuffled at once.
+
+        Args:
+            n: The number of deals to draw.
+            rng: Anything accepted by `numpy.random.default_rng()`, such as a
+                `numpy.random.Generator` or an `int` seed. If omitted, fresh
+                entropy is used.
+
+        Returns:
+            A tuple with one `numpy` array per hand, each of shape
+            `(n, hand_size)`. Each row holds the indexes into `outcomes()` of
+            the cards in that hand, sorted ascending.
+        """
+        import numpy
+
+        rng = numpy.random.default_rng(rng)
+        deck_indexes = numpy.repeat(numpy.arange(len(self.outcomes())),
+                                    self.deck().quantities())
+        total = self.total_cards_dealt()
+        # Shuffle in chunks to bound memory for large decks.
+        chunk_size = max(1, _SAMPLE_CHUNK_ELEMENTS // max(len(deck_indexes), 1))
+        chunks = []
+        for start in range(0, n, chunk_size):
+            rows = min(chunk_size, n - start)
+            shuffled = rng.permuted(numpy.tile(deck_indexes, (rows, 1)),
+                                    axis=1)
+            chunks.append(shuffled[:, :total])
+        if chunks:
+            dealt = numpy.concatenate(chunks, axis=0)
+        else:
+            dealt = numpy.zeros((0, total), dtype=deck_indexes.dtype)
+
+        result = []
+        start = 0
+        for hand_size in self.hand_sizes():
+            result.append(
+                numpy.sort(dealt[:, start:start + hand_size], axis=1))
+            start += hand_size
+        return tuple(result)
+
+    def sample_many(self,
+                    n: int,
+                    /,
+                    *,
+                    rng=None) -> 'Counter[tuple[tuple, ...]]':
+        """EXPERIMENTAL: Draws `n` independent random deals.
+
+        This requires `numpy`. See `sample_array()`.
+
+        Args:
+            n: The number of deals to draw.
+            rng: Anything accepted by `numpy.random.default_rng()`, such as a
+                `numpy.random.Generator` or an `int` seed. If omitted, fresh
+                entropy is used.
+
+        Returns:
+            A `Counter` mapping each distinct sample, in the same format as
+            `sample()`, to the number of times it was drawn.
+        """
+        import numpy
+
+        if not self.outcomes():
+            raise ValueError('Cannot sample from an empty set of outcomes.')
+
+        hands = self.sample_array(n, rng=rng)
+        if self.total_cards_dealt() == 0:
+            return Counter({((), ) * len(hands): n})
+
+        outcomes = self.outcomes()
+        unique_rows, frequencies = numpy.unique(numpy.concatenate(hands,
+                                                                  axis=1),
+                                                axis=0,
+                                                return_counts=True)
+        result: Counter[tuple[tuple, ...]] = Counter()
+        for row, frequency in zip(unique_rows.tolist(), frequencies.tolist()):
+            sample = []
+            start = 0
+            for hand_size in self.hand_sizes():
+                sample.append(
+                    tuple(outcomes[i] for i in row[start:start + hand_size]))
+                start += hand_size
+            result[tuple(sample)] = frequency
+        return result
+
     @cached_property
     def _key_tuple(self) -> tuple:
         return Deal, self.deck(), self.hand_sizes()
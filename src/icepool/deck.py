@@ -136,18 +136,17 @@ class Deck(Population):
         """
         return icepool.Deal(self, *hand_sizes)
 
-    @cached_property
-    def _key_tuple(self) -> tuple:
-        return Deck, tuple(self.items())
+    def __reduce__(self):
+        return Deck._new_deck, (self._data,)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Deck):
             return False
-        return self._key_tuple == other._key_tuple
+        return self._data == other._data
 
     @cached_property
     def _hash(self) -> int:
-        return hash(self._key_tuple)
+        return hash((Deck, self._data))
 
     def __hash__(self) -> int:
         return self._hash
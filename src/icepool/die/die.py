@@ -4,18 +4,23 @@ import icepool
 import icepool.again
 import icepool.format
 import icepool.creation_args
+import icepool.math
 from icepool.counts import Counts, CountsKeysView, CountsValuesView, CountsItemsView
-from icepool.elementwise import unary_elementwise, binary_elementwise
+from icepool.elementwise import (VECTORIZE_MIN_SIZE, unary_elementwise,
+                                 binary_elementwise,
+                                 vectorized_unary_elementwise,
+                                 vectorized_binary_elementwise)
 from icepool.population import Population
 
 import bisect
 from collections import defaultdict
+from fractions import Fraction
 from functools import cache, cached_property
 import itertools
 import math
 import operator
 
-from typing import Any, Callable, Container, Iterator, Mapping, MutableMapping, Sequence, overload
+from typing import Any, Callable, Container, Iterable, Iterator, Mapping, MutableMapping, Sequence, overload
 
 
 def implicit_convert_to_die(outcome) -> 'Die':
@@ -38,6 +43,36 @@ def implicit_convert_to_die(outcome) -> 'Die':
     return Die([outcome])
 
 
+_KEEP_CACHE_SIZE = 64
+"""The maximum number of results kept per `Die` by `Die._keep()`."""
+
+_COMPARE_OPS = frozenset(['<', '<=', '>=', '>', '==', '!='])
+"""Valid operators for `Die.compare_many()`."""
+
+_PLAIN_OUTCOME_TYPES = frozenset([int, float, bool, str, bytes, Fraction])
+"""Outcome types that the `Die` constructor would not expand or reroll."""
+
+
+def _is_plain_outcome(outcome) -> bool:
+    """`True` iff the `Die` constructor would map `outcome` to itself."""
+    if type(outcome) is tuple:
+        return all(_is_plain_outcome(x) for x in outcome)
+    return type(outcome) in _PLAIN_OUTCOME_TYPES
+
+
+def _new_die_from_computed(data: Mapping[Any, int]) -> 'Die':
+    """Creates a `Die` from outcomes computed by an operation.
+
+    If all outcomes are plain, this skips the argument expansion of the `Die`
+    constructor, though the outcomes are still sorted and validated.
+    Otherwise, this falls back to the `Die` constructor, which e.g. expands
+    outcomes that are themselves dice.
+    """
+    if all(_is_plain_outcome(outcome) for outcome in data):
+        return Die._new_die(Counts(data.items()))
+    return Die(data)
+
+
 class Die(Population):
     """Sampling with replacement. Quantities represent weights.
 
@@ -213,10 +248,40 @@ class Die(Population):
                 outcomes[0], Die):
             return outcomes[0]
 
+        return cls._new_die(
+            icepool.creation_args.expand_args_for_die(outcomes, times))
+
+    @classmethod
+    def _new_die(cls, data: Counts) -> 'Die':
+        """Creates a new `Die` using already-processed arguments.
+
+        Args:
+            data: At this point, this is a Counts.
+        """
         self = super(Population, cls).__new__(cls)
-        self._data = icepool.creation_args.expand_args_for_die(outcomes, times)
+        self._data = data
+        return self
+
+    @classmethod
+    def _new_die_from_array(cls, items: Sequence[tuple[Any, int]],
+                            array) -> 'Die':
+        """Creates a new `Die` from the result of a vectorized operation.
+
+        Args:
+            items: The sorted `(outcome, quantity)` items.
+            array: The outcomes as a `numpy` array. This is kept so that
+                further vectorized operations don't need to convert the
+                outcomes again.
+        """
+        self = cls._new_die(Counts._new_sorted(items))
+        if array.ndim == 2:
+            self.__dict__['_int_tuple_array'] = array
         return self
 
+    def _new_from_vectorized(self, items: Sequence[tuple[Any, int]],
+                             array) -> 'Die':
+        return Die._new_die_from_array(items, array)
+
     def unary_op(self, op: Callable, *args, **kwargs) -> 'Die':
         """Performs the unary operation on the outcomes.
 
@@ -240,11 +305,18 @@ class Die(Population):
         Raises:
             ValueError: If tuples are of mismatched length.
         """
+        if (not args and not kwargs and len(self) >= VECTORIZE_MIN_SIZE and
+                self._int_tuple_array is not None):
+            vectorized = vectorized_unary_elementwise(self._int_tuple_array,
+                                                      self.quantities(), op)
+            if vectorized is not None:
+                return Die._new_die_from_array(*vectorized)
+
         data: MutableMapping[Any, int] = defaultdict(int)
         for outcome, quantity in self.items():
             new_outcome = unary_elementwise(outcome, op, *args, **kwargs)
             data[new_outcome] += quantity
-        return icepool.Die(data)
+        return _new_die_from_computed(data)
 
     def binary_op(self, other: 'Die', op: Callable, *args, **kwargs) -> 'Die':
         """Performs the operation on pairs of outcomes.
@@ -280,6 +352,16 @@ class Die(Population):
             ValueError: If tuples are of mismatched length within one of the
                 dice or between the dice.
         """
+        if (not args and not kwargs and
+                len(self) * len(other) >= VECTORIZE_MIN_SIZE and
+                self._int_tuple_array is not None and
+                other._int_tuple_array is not None):
+            vectorized = vectorized_binary_elementwise(
+                self._int_tuple_array, self.quantities(),
+                other._int_tuple_array, other.quantities(), op)
+            if vectorized is not None:
+                return Die._new_die_from_array(*vectorized)
+
         data: MutableMapping[Any, int] = defaultdict(int)
         for (outcome_self,
              quantity_self), (outcome_other,
@@ -288,7 +370,7 @@ class Die(Population):
             new_outcome = binary_elementwise(outcome_self, outcome_other, op,
                                              *args, **kwargs)
             data[new_outcome] += quantity_self * quantity_other
-        return icepool.Die(data)
+        return _new_die_from_computed(data)
 
     # Basic access.
 
@@ -318,7 +400,10 @@ class Die(Population):
 
     def simplify(self) -> 'Die':
         """Divides all quantities by their greatest common denominator. """
-        return icepool.Die(self._data.simplify())
+        data = self._data.simplify()
+        if data is self._data:
+            return self
+        return Die._new_die(data)
 
     # Rerolls and other outcome management.
 
@@ -371,11 +456,9 @@ class Die(Population):
                 }
 
         if depth is None:
-            data = {
-                outcome: quantity
-                for outcome, quantity in self.items()
-                if outcome not in outcomes
-            }
+            data = [(outcome, quantity)
+                    for outcome, quantity in self.items()
+                    if outcome not in outcomes]
         else:
             total_reroll_quantity = sum(
                 quantity for outcome, quantity in self.items()
@@ -383,13 +466,10 @@ class Die(Population):
             rerollable_factor = total_reroll_quantity**depth
             stop_factor = (self.denominator()**depth +
                            total_reroll_quantity**depth)
-            data = {
-                outcome:
-                (rerollable_factor *
-                 quantity if outcome in outcomes else stop_factor * quantity)
-                for outcome, quantity in self.items()
-            }
-        return icepool.Die(data)
+            data = [(outcome, rerollable_factor *
+                     quantity if outcome in outcomes else stop_factor *
+                     quantity) for outcome, quantity in self.items()]
+        return Die._new_die(Counts._new_sorted(data))
 
     def reroll_until(self,
                      outcomes: Callable[..., bool] | Container,
@@ -465,8 +545,7 @@ class Die(Population):
             stop = bisect.bisect_right(self.outcomes(), max_outcome)
         else:
             stop = None
-        data = {k: v for k, v in self.items()[start:stop]}
-        return icepool.Die(data)
+        return Die._new_die(self._data._slice(start, stop))
 
     def clip(self, min_outcome=None, max_outcome=None) -> 'Die':
         """Clips the outcomes of this `Die` to the given values.
@@ -518,12 +597,12 @@ class Die(Population):
 
     def trim(self) -> 'Die':
         """Removes all zero-quantity outcomes. """
-        data = {k: v for k, v in self.items() if v > 0}
-        return icepool.Die(data)
+        data = [(k, v) for k, v in self.items() if v > 0]
+        return Die._new_die(Counts._new_sorted(data))
 
     @cached_property
     def _popped_min(self) -> tuple['Die', int]:
-        die = icepool.Die(self._data.remove_min())
+        die = Die._new_die(self._data.remove_min())
         return die, self.quantities()[0]
 
     def _pop_min(self) -> tuple['Die', int]:
@@ -536,7 +615,7 @@ class Die(Population):
 
     @cached_property
     def _popped_max(self) -> tuple['Die', int]:
-        die = icepool.Die(self._data.remove_max())
+        die = Die._new_die(self._data.remove_max())
         return die, self.quantities()[-1]
 
     def _pop_max(self) -> tuple['Die', int]:
@@ -555,6 +634,7 @@ class Die(Population):
             *extra_dice,
             repeat: int | None = 1,
             star: int = 0,
+            memoize: bool = False,
             **kwargs) -> 'Die':
         """Changes outcomes of the `Die` to other outcomes.
 
@@ -586,6 +666,10 @@ class Die(Population):
                 `*outcome` before giving it to the `repl` function. `extra_dice`
                 are not unpacked. If `repl` is not a callable, this has no
                 effect.
+            memoize: If `True` and `repl` is callable, `repl` is wrapped with
+                `icepool.memoize()`, so results for repeated argument tuples
+                are reused, including across `repeat`s. Only use this if
+                `repl` is pure.
             **kwargs: Any extra keyword arguments are forwarded to the final die
                 constructor.
 
@@ -600,6 +684,9 @@ class Die(Population):
                 'Extra positional arguments are only valid if repl is callable.'
             )
 
+        if memoize and callable(repl):
+            repl = icepool.memoize(repl)
+
         if repeat == 0:
             return self
         elif repeat == 1:
@@ -819,13 +906,17 @@ class Die(Population):
         Returns:
             A `Die` representing the probability distribution of the sum.
         """
+        if keep < 0:
+            raise ValueError(f'keep={keep} cannot be negative.')
+        if drop < 0:
+            raise ValueError(f'drop={drop} cannot be negative.')
+
         if keep == 1 and drop == 0:
             return self._keep_lowest_single(rolls)
 
-        start = drop if drop > 0 else None
-        stop = keep + (drop or 0)
-        sorted_roll_counts = slice(start, stop)
-        return self.pool(rolls)[sorted_roll_counts].sum()
+        start = min(drop, rolls)
+        stop = min(keep + drop, rolls)
+        return self._keep(rolls, start, stop)
 
     def _keep_lowest_single(self, rolls: int, /) -> 'Die':
         """Faster algorithm for keeping just the single lowest `Die`. """
@@ -851,12 +942,17 @@ class Die(Population):
         Returns:
             A `Die` representing the probability distribution of the sum.
         """
+        if keep < 0:
+            raise ValueError(f'keep={keep} cannot be negative.')
+        if drop < 0:
+            raise ValueError(f'drop={drop} cannot be negative.')
+
         if keep == 1 and drop == 0:
             return self._keep_highest_single(rolls)
-        start = -(keep + (drop or 0))
-        stop = -drop if drop > 0 else None
-        sorted_roll_counts = slice(start, stop)
-        return self.pool(rolls)[sorted_roll_counts].sum()
+
+        start = rolls - min(keep + drop, rolls)
+        stop = rolls - min(drop, rolls)
+        return self._keep(rolls, start, stop)
 
     def _keep_highest_single(self, rolls: int, /) -> 'Die':
         """Faster algorithm for keeping just the single highest `Die`. """
@@ -865,6 +961,97 @@ class Die(Population):
         return icepool.from_cumulative_quantities(
             self.outcomes(), [x**rolls for x in self.quantities_le()])
 
+    @cached_property
+    def _keep_cache(self) -> MutableMapping[tuple[int, int, int], 'Die']:
+        """Results of `_keep()`, holding at most `_KEEP_CACHE_SIZE` entries.
+
+        The oldest entry is evicted first.
+        """
+        return {}
+
+    def _keep(self, rolls: int, start: int, stop: int, /) -> 'Die':
+        """Roll this `Die` `rolls` times and sum the sorted dice in `start:stop`.
+
+        This is an order-statistic algorithm specialized for pools consisting
+        of a single type of `Die`. Rather than going through `Pool` and the
+        general `OutcomeCountEvaluator` machinery, it runs a dynamic program
+        over the outcomes, keyed on the number of dice assigned so far and the
+        partial sum of the kept dice. Once all kept dice have been assigned,
+        the remaining dice are accounted for in a single step using the
+        cumulative quantity beyond the current outcome.
+
+        Outcomes are processed starting from whichever end allows more dice to
+        be skipped this way. Since this changes the order in which outcomes
+        are added, it is only used if all outcomes are `int`s or `Fraction`s.
+        Otherwise, this falls back to `Pool` so that the result matches
+        `Pool.sum()` exactly.
+
+        The results are cached. See `misc/benchmark_keep.py` for a comparison
+        against `Pool`.
+
+        Args:
+            rolls: The number of dice to roll.
+            start, stop: The slice of the dice to keep, sorted in ascending
+                order. These should satisfy `0 <= start <= stop <= rolls`.
+        """
+        if not self._is_rational:
+            return self.pool(rolls)[start:stop].sum()  # type: ignore
+
+        cache_key = (rolls, start, stop)
+        if cache_key in self._keep_cache:
+            return self._keep_cache[cache_key]
+
+        if start >= rolls - stop:
+            # Process from the highest outcome down. Flip the slice.
+            items = list(reversed(self.items()))
+            start, stop = rolls - stop, rolls - start
+        else:
+            items = list(self.items())
+
+        # dice assigned so far -> partial sum of kept dice -> weight
+        dist: MutableMapping[int, MutableMapping[Any, int]] = {0: {0: 1}}
+        final: MutableMapping[Any, int] = defaultdict(int)
+        remaining_quantity = self.denominator()
+        for i, (outcome, quantity) in enumerate(items):
+            is_last = i == len(items) - 1
+            remaining_quantity -= quantity
+            next_dist: MutableMapping[int, MutableMapping[Any, int]] = {}
+            for assigned, partials in dist.items():
+                unassigned = rolls - assigned
+                comb_row = icepool.math.comb_row(unassigned, quantity)
+                # Counts from `stop - assigned` up assign all kept dice, so
+                # the rest must roll beyond this outcome. These all add the
+                # same amount to the partial sum.
+                if is_last:
+                    tail_weight = comb_row[unassigned]
+                else:
+                    tail_weight = sum(
+                        comb_row[count] *
+                        remaining_quantity**(unassigned - count)
+                        for count in range(stop - assigned, unassigned + 1))
+                shift = outcome * (stop - max(assigned, start))
+                for partial, weight in partials.items():
+                    final[partial + shift] += weight * tail_weight
+                if is_last:
+                    # No later outcome can assign the rest of the kept dice.
+                    continue
+                for count in range(stop - assigned):
+                    next_assigned = assigned + count
+                    shift = outcome * max(next_assigned - max(assigned, start),
+                                          0)
+                    count_weight = comb_row[count]
+                    next_partials = next_dist.setdefault(
+                        next_assigned, defaultdict(int))
+                    for partial, weight in partials.items():
+                        next_partials[partial + shift] += weight * count_weight
+            dist = next_dist
+
+        result = icepool.Die(final)
+        if len(self._keep_cache) >= _KEEP_CACHE_SIZE:
+            del self._keep_cache[next(iter(self._keep_cache))]
+        self._keep_cache[cache_key] = result
+        return result
+
     # Unary operators.
 
     def __neg__(self) -> 'Die':
@@ -1086,17 +1273,43 @@ class Die(Population):
             hi: The `Die` on the right of `op`.
         """
         if lo.is_empty() or hi.is_empty():
-            return icepool.Die([])
+            return Die._new_die(Counts._new_sorted([]))
 
         d = lo.denominator() * hi.denominator()
 
         # One-outcome cases.
 
         if op(lo.max_outcome(), hi.min_outcome()):
-            return icepool.Die({True: d})
+            return Die._new_die(Counts._new_sorted([(True, d)]))
+
+        if not op(lo.min_outcome(), hi.max_outcome()):
+            return Die._new_die(Counts._new_sorted([(False, d)]))
+
+        n, d = Die._lt_le_quantities(op, lo, hi)
+
+        # We don't use bernoulli because it trims zero-quantity outcomes.
+        return Die._new_die(Counts._new_sorted([(False, d - n), (True, n)]))
+
+    @staticmethod
+    def _lt_le_quantities(op: Callable, lo: 'Die',
+                          hi: 'Die') -> tuple[int, int]:
+        """Linear algorithm for the quantities of < and <=.
+
+        Args:
+            op: Either `operator.lt` or `operator.le`.
+            lo: The `Die` on the left of `op`. Must not be empty.
+            hi: The `Die` on the right of `op`. Must not be empty.
+
+        Returns:
+            The quantity for which `op` is true, and the total quantity.
+        """
+        d = lo.denominator() * hi.denominator()
+
+        if op(lo.max_outcome(), hi.min_outcome()):
+            return d, d
 
         if not op(lo.min_outcome(), hi.max_outcome()):
-            return icepool.Die({False: d})
+            return 0, d
 
         n = 0
 
@@ -1112,8 +1325,7 @@ class Die(Population):
                     break
             n += lo_cweight * hi_weight
 
-        # We don't use bernoulli because it trims zero-quantity outcomes.
-        return icepool.Die({False: d - n, True: n})
+        return n, d
 
     def __lt__(self, other) -> 'Die':
         other = implicit_convert_to_die(other)
@@ -1142,13 +1354,35 @@ class Die(Population):
             a, b: The dice.
         """
         if a.is_empty() or b.is_empty():
-            return Counts([])
+            return Counts._new_sorted([])
+
+        # Single-outcome case.
+        if (a.keys().isdisjoint(b.keys())):
+            d = a.denominator() * b.denominator()
+            return Counts._new_sorted([(invert, d)])
 
+        n, d = Die._eq_quantities(a, b)
+
+        if invert:
+            return Counts._new_sorted([(False, n), (True, d - n)])
+        else:
+            return Counts._new_sorted([(False, d - n), (True, n)])
+
+    @staticmethod
+    def _eq_quantities(a: 'Die', b: 'Die') -> tuple[int, int]:
+        """Linear algorithm for the quantities of ==.
+
+        Args:
+            a, b: The dice. Neither may be empty.
+
+        Returns:
+            The quantity for which the dice roll equal outcomes, and the total
+            quantity.
+        """
         d = a.denominator() * b.denominator()
 
-        # Single-outcome case.
         if (a.keys().isdisjoint(b.keys())):
-            return Counts([(invert, d)])
+            return 0, d
 
         n = 0
 
@@ -1169,10 +1403,7 @@ class Die(Population):
                 else:
                     b_outcome, b_quantity = next(b_iter)
             except StopIteration:
-                if invert:
-                    return Counts([(False, n), (True, d - n)])
-                else:
-                    return Counts([(False, d - n), (True, n)])
+                return n, d
 
     def __eq__(self, other):
         other_die = implicit_convert_to_die(other)
@@ -1196,6 +1427,70 @@ class Die(Population):
 
         return icepool.DieWithTruth(data_callback, truth_value_callback)
 
+    def compare_many(self, op: str, others: Iterable, /) -> tuple[float, ...]:
+        """The probability of each comparison between this `Die` and each of `others`.
+
+        For example, `die.compare_many('>=', range(1, 41))` is equivalent to
+        `[(die >= x).probability(True) for x in range(1, 41)]`, but does not
+        construct any dice. Comparisons against single outcomes use a single
+        merged pass over the sorted outcomes.
+
+        Args:
+            op: One of `'<', '<=', '>=', '>', '==', '!='`. `self` is on the
+                left of the comparison.
+            others: Dice or single outcomes to compare `self` against.
+
+        Returns:
+            A tuple of probabilities, one per element of `others`.
+
+        Raises:
+            ValueError: If `op` is not one of the above.
+        """
+        if op not in _COMPARE_OPS:
+            raise ValueError(f'Invalid comparison operator {op!r}.')
+        others = tuple(others)
+        result: list[float] = [0.0] * len(others)
+
+        # Single outcomes are handled in one batch.
+        outcome_indexes = [
+            i for i, other in enumerate(others) if not isinstance(other, Die)
+        ]
+        outcomes = [others[i] for i in outcome_indexes]
+        if op == '<':
+            quantities = self.quantities_lt_at(outcomes)
+        elif op == '<=':
+            quantities = self.quantities_le_at(outcomes)
+        elif op == '>=':
+            quantities = self.quantities_ge_at(outcomes)
+        elif op == '>':
+            quantities = self.quantities_gt_at(outcomes)
+        elif op == '==':
+            quantities = tuple(self.quantity(x) for x in outcomes)
+        else:
+            quantities = tuple(self.quantity_ne(x) for x in outcomes)
+        for i, quantity in zip(outcome_indexes, quantities):
+            result[i] = quantity / self.denominator()
+
+        for i, other in enumerate(others):
+            if not isinstance(other, Die):
+                continue
+            if self.is_empty() or other.is_empty():
+                raise ZeroDivisionError('Cannot compare empty dice.')
+            if op == '<':
+                n, d = Die._lt_le_quantities(operator.lt, self, other)
+            elif op == '<=':
+                n, d = Die._lt_le_quantities(operator.le, self, other)
+            elif op == '>=':
+                n, d = Die._lt_le_quantities(operator.le, other, self)
+            elif op == '>':
+                n, d = Die._lt_le_quantities(operator.lt, other, self)
+            else:
+                n, d = Die._eq_quantities(self, other)
+                if op == '!=':
+                    n = d - n
+            result[i] = n / d
+        return tuple(result)
+
     def cmp(self, other) -> 'Die':
         """A `Die` with outcomes 1, -1, and 0.
 
@@ -1253,6 +1548,9 @@ class Die(Population):
             'If this is in the conditional of an if-statement, you probably '
             'want to use die.if_else() instead.')
 
+    def __reduce__(self):
+        return type(self)._new_die, (self._data, )
+
     @cached_property
     def _key_tuple(self) -> tuple:
         return tuple(self.items())
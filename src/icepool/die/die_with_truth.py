@@ -57,5 +57,9 @@ class DieWithTruth(Die):
         self._used_callback = True
         return self._truth_value_callback()
 
+    def __reduce__(self):
+        # The callbacks cannot be pickled, so this becomes a plain `Die`.
+        return Die._new_die, (self._data, )
+
     def __bool__(self):
         return self._truth_value
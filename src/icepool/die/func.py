@@ -1,13 +1,17 @@
 __docformat__ = 'google'
 
 import icepool
+from icepool.counts import Counts
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
+import concurrent.futures
 from functools import cache
+import functools
 import itertools
 import math
+import weakref
 
-from typing import Any, Callable, Generator, Sequence
+from typing import Any, Callable, Generator, Mapping, MutableMapping, Sequence
 
 
 @cache
@@ -70,6 +74,7 @@ def one_hot(sides: int, /):
     This is an easy (if expensive) way of representing how many dice in a pool
     rolled each number. For example, the outcomes of `10 @ one_hot(6)` are
     the `(ones, twos, threes, fours, fives, sixes)` rolled in 10d6.
+    `multinomial(d6, 10)` computes the same distribution more efficiently.
     """
     data = []
     for i in range(sides):
@@ -79,6 +84,48 @@ def one_hot(sides: int, /):
     return icepool.Die(data)
 
 
+def multinomial(die, rolls: int, /) -> 'icepool.Die':
+    """A `Die` representing how many times each outcome of `die` was rolled.
+
+    The outcomes are tuples with one count per outcome of `die`, in sorted
+    order. For example, `multinomial(d6, 10)` has the same distribution as
+    `10 @ one_hot(6)`, i.e. the `(ones, twos, threes, fours, fives, sixes)`
+    rolled in 10d6. However, this computes the quantities directly from
+    multinomial coefficients rather than by repeated convolution.
+
+    Args:
+        die: The `Die` to roll, or a single outcome.
+        rolls: The number of times to roll `die`.
+
+    Raises:
+        ValueError: If `rolls` is negative.
+    """
+    if rolls < 0:
+        raise ValueError('rolls cannot be negative.')
+    die = icepool.implicit_convert_to_die(die)
+    if die.is_empty():
+        return icepool.Die([])
+    quantities = die.quantities()
+    last = len(quantities) - 1
+    items = []
+    # Each entry is (counts so far, remaining rolls, product of quantity
+    # powers so far). Smaller counts are pushed last so that outcomes are
+    # produced in sorted order.
+    stack: list[tuple[tuple[int, ...], int, int]] = [((), rolls, 1)]
+    while stack:
+        counts, remaining, weight = stack.pop()
+        i = len(counts)
+        if i == last:
+            counts += (remaining, )
+            items.append((counts, icepool.math.multinomial(*counts) * weight *
+                          quantities[i]**remaining))
+            continue
+        for count in range(remaining, -1, -1):
+            stack.append((counts + (count, ), remaining - count,
+                          weight * quantities[i]**count))
+    return icepool.Die._new_die(Counts._new_sorted(items))
+
+
 def from_cumulative_quantities(outcomes: Sequence,
                                cumulative_quantities: Sequence[int],
                                *,
@@ -173,6 +220,8 @@ def reduce(func: Callable[[Any, Any], Any],
            dice,
            *,
            initial=None,
+           associative: bool = False,
+           max_workers: int | None = None,
            **kwargs) -> 'icepool.Die':
     """Applies a function of two arguments cumulatively to a sequence of dice.
 
@@ -187,9 +236,22 @@ def reduce(func: Callable[[Any, Any], Any],
         dice: A sequence of dice to apply the function to, from left to right.
         initial: If provided, this will be placed at the front of the sequence
             of dice.
+        associative: If `True`, `func` is assumed to be associative, i.e.
+            `func(func(a, b), c) == func(a, func(b, c))`. Then the dice are
+            combined pairwise in a balanced tree rather than from left to
+            right, preserving their order. Identical pairs within each level
+            of the tree are only combined once, so e.g. reducing 32 copies
+            of the same `Die` takes only 5 combinations.
+        max_workers: EXPERIMENTAL: Only used if `associative` is set. If
+            provided, the distinct pairs in each level of the tree are combined
+            in this many worker processes using
+            `concurrent.futures.ProcessPoolExecutor`. In this case `func` must
+            be picklable, e.g. a module-level function or one from `operator`.
         **kwargs: Any extra keyword arguments are forwarded to the die
             constructor for the final result.
     """
+    if associative:
+        return _reduce_associative(func, dice, initial, max_workers, kwargs)
     # Conversion to dice is not necessary since apply() takes care of that.
     iter_dice = iter(dice)
     if initial is not None:
@@ -201,6 +263,47 @@ def reduce(func: Callable[[Any, Any], Any],
     return result
 
 
+def _reduce_associative(func: Callable[[Any, Any], Any], dice, initial,
+                        max_workers: int | None,
+                        kwargs: Mapping[str, Any]) -> 'icepool.Die':
+    """Implementation of `reduce(..., associative=True)`."""
+    level = [icepool.implicit_convert_to_die(die) for die in dice]
+    if initial is not None:
+        level.insert(0, icepool.implicit_convert_to_die(initial))
+    if not level:
+        raise TypeError('reduce() of empty sequence with no initial value')
+
+    combine = functools.partial(_apply_pair, func, kwargs)
+    executor = None
+    if max_workers is not None:
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers)
+    try:
+        while len(level) > 1:
+            pairs = [(level[i], level[i + 1])
+                     for i in range(0, len(level) - 1, 2)]
+            unique = list(dict.fromkeys(pairs))
+            if executor is None:
+                unique_results = [combine(pair) for pair in unique]
+            else:
+                unique_results = list(executor.map(combine, unique))
+            results = dict(zip(unique, unique_results))
+            next_level = [results[pair] for pair in pairs]
+            if len(level) % 2:
+                next_level.append(level[-1])
+            level = next_level
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    return level[0]
+
+
+def _apply_pair(func: Callable[[Any, Any], Any], kwargs: Mapping[str, Any],
+                pair: tuple['icepool.Die', 'icepool.Die']) -> 'icepool.Die':
+    """Applies `func` to a pair of dice. Module-level so that it can be pickled."""
+    return apply(func, *pair, **kwargs)
+
+
 def accumulate(func: Callable[[Any, Any], Any],
                dice,
                *,
@@ -260,7 +363,67 @@ def iter_product_args(*args) -> Generator[tuple[tuple, int], None, None]:
         yield outcomes, final_quantity
 
 
-def apply(func: Callable, *dice, **kwargs) -> 'icepool.Die':
+MEMOIZE_CACHE_SIZE = 4096
+"""The maximum number of results kept per function by `memoize()`."""
+
+_memoize_caches: 'weakref.WeakKeyDictionary[Callable, OrderedDict[tuple, Any]]' = weakref.WeakKeyDictionary(
+)
+"""Caches for `memoize()`, keyed by the original function."""
+
+
+def memoize(func: Callable, /) -> Callable:
+    """Decorator that caches the results of a pure function per argument tuple.
+
+    The cache belongs to the original function, so all memoized wrappers of
+    the same function share it, across calls to `apply()` and across dice.
+    This is useful when `func` is expensive, e.g. it constructs or evaluates
+    dice, and is called repeatedly on the same outcomes.
+
+    The cache keeps at most `MEMOIZE_CACHE_SIZE` results, evicting the least
+    recently used first. As with `functools.lru_cache(typed=True)`, arguments
+    of different types are cached separately, so e.g. `1`, `1.0` and `True`
+    don't share a result. The wrapper has a `cache_clear()` method to clear
+    the cache.
+
+    Only positional arguments are supported. Arguments that are not hashable
+    bypass the cache.
+    """
+    if getattr(func, '_icepool_memoized', False):
+        return func
+    try:
+        cache = _memoize_caches.setdefault(func, OrderedDict())
+    except TypeError:
+        # Not weakly referenceable, e.g. some builtins.
+        cache = OrderedDict()
+
+    @functools.wraps(func)
+    def memoized(*args):
+        key = (args, tuple(type(arg) for arg in args))
+        try:
+            result = cache[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable arguments.
+            return func(*args)
+        else:
+            cache.move_to_end(key)
+            return result
+        result = cache[key] = func(*args)
+        if len(cache) > MEMOIZE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    memoized._icepool_memoized = True  # type: ignore
+    memoized.cache_clear = cache.clear  # type: ignore
+    return memoized
+
+
+def apply(func: Callable,
+          *dice,
+          memoize: bool = False,
+          vectorized: bool = False,
+          **kwargs) -> 'icepool.Die':
     """Applies `func(outcome_of_die_0, outcome_of_die_1, ...)` for all outcomes of the dice.
 
     Example: `apply(lambda a, b: a + b, d6, d6)` is the same as d6 + d6.
@@ -283,6 +446,16 @@ def apply(func: Callable, *dice, **kwargs) -> 'icepool.Die':
         *dice: Any number of dice (or objects convertible to dice).
             `func` will be called with all joint outcomes of `dice`, with one
             argument per `Die`.
+        memoize: If `True`, `func` is wrapped with `memoize()`, so results
+            are cached per argument tuple across calls. Only use this if
+            `func` is pure. This has no effect if `vectorized` is set.
+        vectorized: EXPERIMENTAL: If `True`, `func` is called only once, with
+            one `numpy` array of outcomes per `Die`. These arrays broadcast
+            against each other to cover all joint outcomes, and `func` must
+            return an array (or scalar) of the broadcast shape, e.g. using
+            arithmetic operators and `numpy` ufuncs. All outcomes must be
+            numbers, and `func` cannot return `Reroll` or dice.
+            This requires `numpy`.
         **kwargs: Any extra keyword arguments are forwarded to the die
             constructor for the final result.
 
@@ -296,6 +469,10 @@ def apply(func: Callable, *dice, **kwargs) -> 'icepool.Die':
         )
     if len(dice) == 0:
         return icepool.Die([func()], **kwargs)
+    if vectorized:
+        return _apply_vectorized(func, dice, kwargs)
+    if memoize:
+        func = icepool.memoize(func)
     final_outcomes = []
     final_quantities = []
     for outcomes, final_quantity in iter_product_args(*dice):
@@ -307,6 +484,48 @@ def apply(func: Callable, *dice, **kwargs) -> 'icepool.Die':
     return icepool.Die(final_outcomes, final_quantities, **kwargs)
 
 
+def _apply_vectorized(func: Callable, dice: Sequence,
+                      kwargs: Mapping[str, Any]) -> 'icepool.Die':
+    """Implementation of `apply(..., vectorized=True)`."""
+    import numpy
+
+    converted_dice = [icepool.implicit_convert_to_die(die) for die in dice]
+    if any(die.is_empty() for die in converted_dice):
+        return icepool.Die([], **kwargs)
+
+    outcome_arrays = []
+    for die in converted_dice:
+        outcome_array = numpy.asarray(die.outcomes())
+        if outcome_array.ndim != 1 or outcome_array.dtype.kind not in 'biuf':
+            raise TypeError(
+                'vectorized=True requires all outcomes to be numbers.')
+        outcome_arrays.append(outcome_array)
+
+    # Quantities that could overflow int64 fall back to Python ints.
+    if math.prod(die.denominator() for die in converted_dice) < 2**63:
+        quantity_dtype: Any = numpy.int64
+    else:
+        quantity_dtype = object
+
+    outcome_grids = numpy.meshgrid(*outcome_arrays, indexing='ij', sparse=True)
+    quantity_grids = numpy.meshgrid(*(numpy.array(
+        die.quantities(), dtype=quantity_dtype) for die in converted_dice),
+                                    indexing='ij',
+                                    sparse=True)
+    shape = tuple(len(die) for die in converted_dice)
+    quantities = numpy.broadcast_to(math.prod(quantity_grids), shape)
+    results = numpy.broadcast_to(numpy.asarray(func(*outcome_grids)), shape)
+
+    # Group equal results by sorting, then sum their quantities.
+    final_outcomes, inverse = numpy.unique(results.ravel(),
+                                           return_inverse=True)
+    final_quantities = numpy.zeros(len(final_outcomes), dtype=quantity_dtype)
+    numpy.add.at(final_quantities, inverse.ravel(), quantities.ravel())
+
+    return icepool.Die(final_outcomes.tolist(), final_quantities.tolist(),
+                       **kwargs)
+
+
 class apply_sorted():
     """This is really a function implemented as a class.
 
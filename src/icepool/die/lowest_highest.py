@@ -72,6 +72,9 @@ def _lowest_highest(*dice, start: int, stop: int) -> 'icepool.Die':
     if start == len(dice) - 1:
         return _highest_single(*dice)
 
+    if all(die.equals(dice[0]) for die in dice[1:]):
+        return dice[0]._keep(len(dice), start, stop)
+
     # Use pool.
     return icepool.Pool(dice)[start:stop].sum()
 
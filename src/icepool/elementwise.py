@@ -1,6 +1,20 @@
 __docformat__ = 'google'
 
-from typing import Any, Callable
+import operator
+
+from typing import Any, Callable, Sequence
+
+VECTORIZE_MIN_SIZE = 256
+"""The minimum number of outcomes (or outcome pairs) for which elementwise operations are vectorized using `numpy`."""
+
+_VECTORIZED_UNARY_OPS = frozenset([operator.neg, operator.pos, operator.abs])
+"""Unary operations that can be vectorized on `int` tuples."""
+
+_VECTORIZED_BINARY_OPS = frozenset([operator.add, operator.sub, operator.mul])
+"""Binary operations that can be vectorized on `int` tuples."""
+
+_INT64_LIMIT = 2**63
+"""Values must have absolute value strictly less than this to be represented in `int64`."""
 
 
 def tuple_len(a) -> int | None:
@@ -64,3 +78,166 @@ def binary_elementwise(a, b, op: Callable, *args, **kwargs):
             )
     return tuple(
         binary_elementwise(aa, bb, op, *args, **kwargs) for aa, bb in zip(a, b))
+
+
+def int_tuple_array(outcomes: Sequence):
+    """Converts outcomes that are tuples of `int`s to a 2-D `numpy` array.
+
+    Each row of the result is one outcome. If all elements are `bool`s, the
+    array has `bool` dtype; otherwise it has `int64` dtype.
+
+    Returns:
+        The array, or `None` if `numpy` is not available, or the outcomes are
+        not all non-empty tuples of the same length whose elements are all
+        `int`s (without mixing `bool`s and other `int`s) within `int64` range.
+    """
+    if not outcomes:
+        return None
+    width = tuple_len(outcomes[0])
+    if not width:
+        return None
+    all_bool = True
+    any_bool = False
+    for outcome in outcomes:
+        if tuple_len(outcome) != width:
+            return None
+        for x in outcome:
+            if type(x) is bool:
+                any_bool = True
+            elif type(x) is int:
+                all_bool = False
+                if not -_INT64_LIMIT < x < _INT64_LIMIT:
+                    return None
+            else:
+                return None
+    if any_bool and not all_bool:
+        return None
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy.array(outcomes, dtype=bool if all_bool else numpy.int64)
+
+
+def _max_abs(array) -> int:
+    if array.size == 0:
+        return 0
+    return max(abs(int(array.min())), abs(int(array.max())))
+
+
+def _group_rows(results, quantities) -> tuple[list[tuple[Any, int]], Any]:
+    """Sums `quantities` by equal rows of `results`.
+
+    Returns:
+        The sorted items, with rows converted back to tuples, or to scalars if
+        `results` is 1-D; and the array of unique rows.
+    """
+    import numpy
+
+    if results.ndim == 1:
+        unique, inverse = numpy.unique(results, return_inverse=True)
+    else:
+        unique, inverse = numpy.unique(results, axis=0, return_inverse=True)
+    final_quantities = numpy.zeros(len(unique), dtype=quantities.dtype)
+    numpy.add.at(final_quantities, inverse.reshape(-1), quantities)
+    if results.ndim == 1:
+        final_outcomes = unique.tolist()
+    else:
+        final_outcomes = [tuple(row) for row in unique.tolist()]
+    return list(zip(final_outcomes,
+                    (int(q) for q in final_quantities))), unique
+
+
+def _quantity_array(quantities: Sequence[int], limit: int):
+    """Converts quantities to `int64`, or Python `int`s if `limit` may overflow."""
+    import numpy
+
+    if limit < _INT64_LIMIT:
+        return numpy.array(quantities, dtype=numpy.int64)
+    return numpy.array(quantities, dtype=object)
+
+
+def vectorized_unary_elementwise(array, quantities: Sequence[int],
+                                 op: Callable) -> tuple[list[tuple[Any, int]], Any] | None:
+    """Applies a unary operation elementwise to an array from `int_tuple_array()`.
+
+    Args:
+        array: The outcomes as produced by `int_tuple_array()`.
+        quantities: The quantity of each outcome.
+        op: The operation to perform.
+
+    Returns:
+        The resulting `(outcome, quantity)` items in sorted order and the array
+        of resulting outcomes, or `None` if the operation cannot be
+        vectorized.
+    """
+    if op not in _VECTORIZED_UNARY_OPS:
+        return None
+    array = array.astype('int64')
+    results = op(array)
+    return _group_rows(results, _quantity_array(quantities, sum(quantities)))
+
+
+def vectorized_binary_elementwise(
+        a, a_quantities: Sequence[int], b, b_quantities: Sequence[int],
+        op: Callable) -> tuple[list[tuple[Any, int]], Any] | None:
+    """Applies a binary operation elementwise to all pairs of rows of two arrays from `int_tuple_array()`.
+
+    Args:
+        a, b: The outcomes as produced by `int_tuple_array()`.
+        a_quantities, b_quantities: The quantity of each outcome.
+        op: The operation to perform.
+
+    Returns:
+        The resulting `(outcome, quantity)` items in sorted order and the array
+        of resulting outcomes, or `None` if the operation cannot be vectorized,
+        or if the results might overflow `int64`.
+
+    Raises:
+        ValueError: If the tuples are of different lengths.
+    """
+    if op not in _VECTORIZED_BINARY_OPS:
+        return None
+    if a.shape[1] != b.shape[1]:
+        raise ValueError(
+            f'Cannot apply operation elementwise between tuples of different lengths {a.shape[1]} and {b.shape[1]}.'
+        )
+    a_bound = _max_abs(a)
+    b_bound = _max_abs(b)
+    if op is operator.mul:
+        bound = a_bound * b_bound
+    else:
+        bound = a_bound + b_bound
+    if bound >= _INT64_LIMIT:
+        return None
+    a = a.astype('int64')
+    b = b.astype('int64')
+    results = op(a[:, None, :], b[None, :, :]).reshape(-1, a.shape[1])
+    a_q = _quantity_array(a_quantities, sum(a_quantities) * sum(b_quantities))
+    b_q = _quantity_array(b_quantities, sum(a_quantities) * sum(b_quantities))
+    quantities = (a_q[:, None] * b_q[None, :]).reshape(-1)
+    return _group_rows(results, quantities)
+
+
+def vectorized_getitem(array, quantities: Sequence[int],
+                       dims: int | slice) -> tuple[list[tuple[Any, int]], Any] | None:
+    """Applies the `[]` operator to each row of an array from `int_tuple_array()`.
+
+    This is used for `marginals`.
+
+    Args:
+        array: The outcomes as produced by `int_tuple_array()`.
+        quantities: The quantity of each outcome.
+        dims: The index or slice to select.
+
+    Returns:
+        The resulting `(outcome, quantity)` items in sorted order and the array
+        of resulting outcomes, or `None` if `dims` selects no elements.
+
+    Raises:
+        IndexError: If `dims` is out of range.
+    """
+    results = array[:, dims]
+    if results.ndim == 2 and results.shape[1] == 0:
+        return None
+    return _group_rows(results, _quantity_array(quantities, sum(quantities)))
@@ -1,30 +1,112 @@
 __docformat__ = 'google'
 
-from typing import Generator, MutableMapping
+from functools import lru_cache
+import itertools
+import math
 
-# b -> list of rows
-comb_row_cache: MutableMapping[int, list[tuple[int, ...]]] = {}
+from typing import Generator, Mapping
+
+COMB_ROW_CACHE_SIZE = 1024
+"""The maximum number of rows kept by the `comb_row()` cache.
+
+Least recently used rows are evicted first.
+"""
+
+COMB_ROW_CACHE_MAX_N = 4096
+"""Rows with `n` greater than this are computed without being cached."""
+
+MULTINOMIAL_CACHE_SIZE = 4096
+"""The maximum number of results kept by the `multinomial()` cache."""
+
+HYPERGEOM_CACHE_SIZE = 256
+"""The maximum number of results kept by each of the `hypergeom_splits()`, `deal_splits()` and `split_pair_counts()` caches."""
+
+
+def _comb_row(n: int, b: int) -> tuple[int, ...]:
+    """Uncached implementation of `comb_row()`."""
+    row = [1]
+    x = 1
+    for k in range(1, n + 1):
+        # comb(n, k-1) * (n-k+1) is always divisible by k.
+        x = x * (n - k + 1) * b // k
+        row.append(x)
+    return tuple(row)
+
+
+_comb_row_cached = lru_cache(maxsize=COMB_ROW_CACHE_SIZE)(_comb_row)
 
 
 def comb_row(n: int, b: int) -> tuple[int, ...]:
     """A tuple of n+1 elements, where the kth element is equal to math.comb(n, k) * b ** k.
 
-    The results are cached.
+    The results are cached for `n` up to `COMB_ROW_CACHE_MAX_N`, keeping at
+    most `COMB_ROW_CACHE_SIZE` rows.
     """
-    if b not in comb_row_cache:
-        comb_row_cache[b] = [(1,)]
-    rows = comb_row_cache[b]
-    while len(rows) < n + 1:
-        prev = rows[-1]
-        next = (1,) + tuple(
-            x + b * y for x, y in zip(prev[1:], prev[:-1])) + (b * prev[-1],)
-        rows.append(next)
-    return rows[n]
+    if n > COMB_ROW_CACHE_MAX_N:
+        return _comb_row(n, b)
+    return _comb_row_cached(n, b)
+
+
+def comb_row_cache_info():
+    """Statistics of the `comb_row()` cache, as `functools.lru_cache`'s `cache_info()`."""
+    return _comb_row_cached.cache_info()
+
+
+def clear_comb_row_cache() -> None:
+    """Clears the `comb_row()` cache."""
+    _comb_row_cached.cache_clear()
+
+
+def clear_caches() -> None:
+    """Clears all caches in this module."""
+    clear_comb_row_cache()
+    _multinomial.cache_clear()
+    hypergeom_splits.cache_clear()
+    split_pair_counts.cache_clear()
+    deal_transition_count.cache_clear()
+    deal_splits.cache_clear()
 
 
 def comb(n: int, k: int, b: int = 1) -> int:
-    """As `math.comb()`, but using the cached `comb_row()`."""
-    return comb_row(n, b)[k]
+    """As `math.comb()`, but multiplied by `b ** k`."""
+    if b == 1:
+        return math.comb(n, k)
+    return math.comb(n, k) * b**k
+
+
+_factorials: list[int] = [1]
+"""`_factorials[n]` is `n!`. This is extended as needed."""
+
+
+def factorial(n: int) -> int:
+    """As `math.factorial()`, but using a table that is extended as needed."""
+    if n < 0:
+        raise ValueError('factorial() not defined for negative values.')
+    while len(_factorials) <= n:
+        _factorials.append(_factorials[-1] * len(_factorials))
+    return _factorials[n]
+
+
+@lru_cache(maxsize=MULTINOMIAL_CACHE_SIZE)
+def _multinomial(counts: tuple[int, ...]) -> int:
+    result = factorial(sum(counts))
+    for count in counts:
+        result //= factorial(count)
+    return result
+
+
+def multinomial(*counts: int) -> int:
+    """The multinomial coefficient `sum(counts)! / prod(count! for count in counts)`.
+
+    Results are cached, regardless of the order of `counts`, keeping at most
+    `MULTINOMIAL_CACHE_SIZE` results.
+
+    Args:
+        *counts: The size of each group.
+    """
+    if any(count < 0 for count in counts):
+        raise ValueError('counts cannot be negative.')
+    return _multinomial(tuple(sorted(counts)))
 
 
 def iter_hypergeom(
@@ -32,6 +114,8 @@ def iter_hypergeom(
         draws: int) -> Generator[tuple[tuple[int, ...], int], None, None]:
     """Iterates over the (hand, weight)s in the given `Deck`.
 
+    This is a generator over the cached result of `hypergeom_splits()`.
+
     Args:
         deck: The number of duplicates of each card in the `Deck`.
         draws: The total number of cards to draw.
@@ -40,17 +124,180 @@ def iter_hypergeom(
         hand: A tuple of how many of each card were drawn.
         weight: The weight of drawing that hand.
     """
+    yield from hypergeom_splits(deck, draws)
+
+
+@lru_cache(maxsize=HYPERGEOM_CACHE_SIZE)
+def hypergeom_splits(deck: tuple[int, ...],
+                     draws: int) -> tuple[tuple[tuple[int, ...], int], ...]:
+    """All (hand, weight)s in the given `Deck` as a tuple.
+
+    This is computed iteratively from the last card backwards, so the tails
+    are computed once per remaining number of draws and shared between all
+    heads. The results are cached, keeping at most `HYPERGEOM_CACHE_SIZE`
+    results.
+
+    Args:
+        deck: The number of duplicates of each card in the `Deck`.
+        draws: The total number of cards to draw.
+
+    Returns:
+        A tuple of (hand, weight) pairs, where hand is a tuple of how many of
+        each card were drawn and weight is the weight of drawing that hand.
+    """
     if len(deck) == 0:
-        yield (), 1
-        return
+        return (((), 1),)
+
+    suffix_sizes = tuple(itertools.accumulate(reversed(deck),
+                                              initial=0))[::-1]
+    deck_size = suffix_sizes[0]
+
+    # draws remaining -> splits of the cards from index i onwards.
+    tails: Mapping[int, tuple[tuple[tuple[int, ...], int], ...]] = {
+        d: (((), 1),)
+        for d in range(max(0, draws - deck_size), min(draws, 0) + 1)
+    }
+    for i in range(len(deck) - 1, -1, -1):
+        deck_count = deck[i]
+        tail_size = suffix_sizes[i + 1]
+        min_draws = max(0, draws - (deck_size - suffix_sizes[i]))
+        max_draws = min(draws, suffix_sizes[i])
+        next_tails = {}
+        for d in range(min_draws, max_draws + 1):
+            min_count = max(0, d - tail_size)
+            max_count = min(deck_count, d)
+            splits = []
+            for count in range(min_count, max_count + 1):
+                weight = comb(d, count)
+                for tail_count, tail_weight in tails.get(d - count, ()):
+                    splits.append(((count,) + tail_count, weight * tail_weight))
+            next_tails[d] = tuple(splits)
+        tails = next_tails
+    return tails.get(draws, ())
+
+
+@lru_cache(maxsize=HYPERGEOM_CACHE_SIZE)
+def deal_splits(hand_sizes: tuple[int, ...], deck_count: int,
+                min_total: int) -> tuple[tuple[tuple[int, ...], int], ...]:
+    """All ways to deal some of `deck_count` identical cards to hands of the given sizes.
+
+    This covers each total number of those cards dealt from `min_total` to
+    `min(deck_count, sum(hand_sizes))`. The weights are
+    `comb(deck_count, total) * multinomial(*counts)`, i.e. the ways to choose
+    which of the cards are dealt times the ways to split them among the
+    hands. These are precomputed so that popping a `Deal` does not need any
+    big-int multiplication. The results are cached, keeping at most
+    `HYPERGEOM_CACHE_SIZE` results.
+
+    Args:
+        hand_sizes: The number of cards remaining to be dealt to each hand.
+        deck_count: The number of identical cards.
+        min_total: The minimum total number of those cards to deal.
+
+    Returns:
+        A tuple of (counts, weight) pairs, where counts is a tuple of how many
+        of the cards were dealt to each hand.
+    """
+    result = []
+    for total in range(min_total, min(deck_count, sum(hand_sizes)) + 1):
+        weight_total = comb(deck_count, total)
+        for counts, weight_split in hypergeom_splits(hand_sizes, total):
+            result.append((counts, weight_total * weight_split))
+    return tuple(result)
+
 
-    deck_count = deck[0]
-    deck_size = sum(deck)  # assume deck is small?
+@lru_cache(maxsize=HYPERGEOM_CACHE_SIZE)
+def deal_transition_count(deck_counts: tuple[int, ...],
+                          hand_sizes: tuple[int, ...]) -> int:
+    """The number of transitions between deals over a full evaluation.
 
-    min_count = max(0, deck_count + draws - deck_size)
-    max_count = min(deck_count, draws)
+    At the boundary after each outcome, the reachable deals are those where
+    the total number of cards dealt so far is at most the number of cards
+    passed, and at least the number needed so that the remaining cards can
+    fill the hands. Transitions across an outcome with `n` copies are pairs of
+    reachable states where the later state dealt at most `n` more cards to
+    the hands.
 
-    for count in range(min_count, max_count + 1):
-        weight = comb(draws, count)
-        for tail_count, tail_weight in iter_hypergeom(deck[1:], draws - count):
-            yield (count,) + tail_count, weight * tail_weight
+    The results are cached, keeping at most `HYPERGEOM_CACHE_SIZE` results.
+
+    Args:
+        deck_counts: The number of copies of each card in the deck, in order.
+        hand_sizes: The size of each hand, sorted.
+
+    Returns:
+        The number of transitions, or 1 if there are none.
+    """
+    total = sum(hand_sizes)
+    pair_counts = split_pair_counts(hand_sizes)
+    size = sum(deck_counts)
+    passed = 0
+    result = 0
+    # No cards have been dealt before the first outcome.
+    lo = hi = 0
+    for deck_count in deck_counts:
+        passed += deck_count
+        next_lo = max(0, total - (size - passed))
+        next_hi = min(passed, total)
+        for s in range(lo, hi + 1):
+            row = pair_counts[s]
+            for t in range(max(0, next_lo - s),
+                           min(deck_count, next_hi - s) + 1):
+                result += row[t]
+        lo, hi = next_lo, next_hi
+    return max(result, 1)
+
+
+@lru_cache(maxsize=HYPERGEOM_CACHE_SIZE)
+def split_pair_counts(hand_sizes: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
+    """Counts pairs of partial deals where the second extends the first.
+
+    This is used to estimate the cost of evaluating a `Deal`. The results are
+    cached, keeping at most `HYPERGEOM_CACHE_SIZE` results.
+
+    Returns:
+        A table where entry `[s][t]` is the number of pairs of count vectors
+        `x <= y <= hand_sizes` such that `sum(x) == s` and
+        `sum(y) - sum(x) == t`.
+    """
+    total = sum(hand_sizes)
+    # Entry [s][t] for s + t <= total.
+    table = [[0] * (total + 1 - s) for s in range(total + 1)]
+    table[0][0] = 1
+    for h in hand_sizes:
+        # Prefix sums along t, so that windows of t can be summed in O(1).
+        prefix = [list(itertools.accumulate(row, initial=0)) for row in table]
+        next_table = [[0] * (total + 1 - s) for s in range(total + 1)]
+        for s in range(total + 1):
+            for t in range(total + 1 - s):
+                acc = 0
+                # This hand received x before and z in [0, h - x] after.
+                for x in range(min(h, s) + 1):
+                    row = prefix[s - x]
+                    stop = min(t, len(row) - 2)
+                    start = t - (h - x)
+                    if stop >= start:
+                        acc += row[stop + 1] - row[max(start, 0)]
+                next_table[s][t] = acc
+        table = next_table
+    return tuple(tuple(row) for row in table)
+
+
+def wilson_interval(successes: int, trials: int,
+                    z: float) -> tuple[float, float]:
+    """The Wilson score interval for a binomial proportion.
+
+    Args:
+        successes: The number of successes observed.
+        trials: The number of trials. Must be positive.
+        z: The number of standard deviations of the normal approximation,
+            e.g. 1.96 for a 95% confidence interval.
+
+    Returns:
+        The lower and upper bounds of the interval.
+    """
+    p = successes / trials
+    z2 = z * z
+    center = (p + z2 / (2 * trials)) / (1 + z2 / trials)
+    margin = z * math.sqrt(p * (1 - p) / trials + z2 /
+                           (4 * trials * trials)) / (1 + z2 / trials)
+    return max(0.0, center - margin), min(1.0, center + margin)
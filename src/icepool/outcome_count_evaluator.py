@@ -1,20 +1,28 @@
 __docformat__ = 'google'
 
 import icepool
+import icepool.math
 from icepool.alignment import Alignment
 
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import Counter, defaultdict
+import concurrent.futures
+import copy
 import enum
+import functools
 from functools import cached_property
 import itertools
 import math
+import statistics
 
-from typing import Any, Callable, Collection, Hashable, Mapping, MutableMapping, Sequence
+from typing import Any, Callable, Collection, Hashable, Iterable, Mapping, MutableMapping, Sequence
 
 PREFERRED_ORDER_COST_FACTOR = 10
 """The preferred order will be favored this times as much."""
 
+DEFAULT_ESTIMATE_SAMPLES = 10000
+"""The default number of samples used by `OutcomeCountEvaluator.estimate()`."""
+
 
 class Order(enum.IntEnum):
     """Can be used to define what order outcomes are seen in by OutcomeCountEvaluators."""
@@ -210,6 +218,36 @@ class OutcomeCountEvaluator(ABC):
         max_outcome = max(generator.max_outcome() for generator in generators)
         return range(min_outcome, max_outcome + 1)
 
+    def symmetric_hands(self,
+                        *generators: icepool.OutcomeCountGenerator) -> bool:
+        """EXPERIMENTAL: Optional method to declare that evaluation is symmetric in the hands of a `Deal`.
+
+        There is no expectation that a subclass be able to handle
+        an arbitrary number of generators. Thus, you are free to rename any of
+        the parameters in a subclass, or to replace `*generators` with a fixed
+        set of parameters.
+
+        If this returns `True` and a single `Deal` is being evaluated, hands
+        are treated as interchangeable: after each outcome, the hands are
+        reordered into a canonical order and states that differ only by the
+        order of the hands are merged. For `k` hands of the same size, this
+        can shrink the number of states by up to a factor of `k!`.
+
+        This is only valid if all of the following hold:
+
+        * Every state returned by `next_state()` is a tuple with one element
+            per hand.
+        * Permuting the counts given to `next_state()`, along with the
+            elements of the previous state, permutes the elements of the
+            resulting state in the same way.
+        * `final_outcome()` does not depend on the order of the elements of
+            the final state.
+
+        The default implementation returns `False`. This has no effect on
+        evaluations of anything other than a single `Deal`.
+        """
+        return False
+
     def final_kwargs(
             self,
             *generators: icepool.OutcomeCountGenerator) -> Mapping[str, Any]:
@@ -221,10 +259,12 @@ class OutcomeCountEvaluator(ABC):
         """A cache of (order, generators) -> weight distribution over states. """
         return {}
 
-    def evaluate(
-        self, *generators: icepool.OutcomeCountGenerator | Mapping[Any, int] |
-        Sequence
-    ) -> 'icepool.Die':
+    def evaluate(self,
+                 *generators: icepool.OutcomeCountGenerator |
+                 Mapping[Any, int] | Sequence,
+                 max_cost: int | None = None,
+                 samples: int | None = None,
+                 rng=None) -> 'icepool.Die':
         """Evaluates generator(s).
 
         You can call the `OutcomeCountEvaluator` object directly for the same effect,
@@ -238,32 +278,120 @@ class OutcomeCountEvaluator(ABC):
                 * A `OutcomeCountGenerator`.
                 * A mappable mapping dice to the number of those dice.
                 * A sequence of arguments to create a `Pool`.
+            max_cost: EXPERIMENTAL: If provided, and the estimated cost of
+                exact evaluation exceeds this, the result is instead
+                approximated using `estimate()` with the given `samples` and
+                `rng`. This requires `numpy`.
+            samples: The number of samples to use if the result is estimated.
+                Defaults to `DEFAULT_ESTIMATE_SAMPLES`. Requires `max_cost`.
+            rng: The random generator to use if the result is estimated.
+                Requires `max_cost`.
 
         Returns:
             A `Die` representing the distribution of the final score.
+
+        Raises:
+            ValueError: If `samples` or `rng` is provided without `max_cost`.
         """
+        if max_cost is None and (samples is not None or rng is not None):
+            raise ValueError('samples and rng require max_cost.')
+        if samples is None:
+            samples = DEFAULT_ESTIMATE_SAMPLES
 
         # Convert non-`Pool` arguments to `Pool`.
-        converted_generators = tuple(
-            generator if isinstance(generator, icepool.OutcomeCountGenerator
-                                   ) else icepool.Pool(generator)
-            for generator in generators)
+        converted_generators = _convert_generators(generators)
 
         if not all(generator._is_resolvable()
                    for generator in converted_generators):
             return icepool.Die([])
 
+        if max_cost is not None and self._estimate_cost(
+                *converted_generators) > max_cost:
+            result, _ = self.estimate(*converted_generators,
+                                      samples=samples,
+                                      rng=rng)
+            return result
+
         algorithm, order = self._select_algorithm(*converted_generators)
 
+        if len(converted_generators) == 1 and isinstance(
+                converted_generators[0],
+                icepool.Deal) and self.symmetric_hands(*converted_generators):
+            algorithm = self._eval_internal_symmetric_hands
+
         # We use a separate class to guarantee all outcomes are visited.
         alignment = Alignment(self.alignment(*converted_generators))
 
         dist = algorithm(order, alignment, tuple(converted_generators))
 
+        return self._final_die(dist, converted_generators)
+
+    __call__ = evaluate
+
+    def evaluate_many(self,
+                      generators_list: Iterable[icepool.OutcomeCountGenerator |
+                                                tuple],
+                      /,
+                      *,
+                      max_workers: int | None = None) -> tuple['icepool.Die', ...]:
+        """EXPERIMENTAL: Evaluates many sets of generators with this evaluator.
+
+        Identical sets of generators are only evaluated once. The rest are
+        evaluated from cheapest to most expensive, so that the intermediate
+        results cached by smaller evaluations can be reused by larger ones.
+
+        Args:
+            generators_list: Each element is either a single
+                `OutcomeCountGenerator`, or a tuple of arguments as would be
+                given to `evaluate()`. Any other element is treated as a single
+                argument to `evaluate()`.
+            max_workers: If provided, the evaluations are distributed over
+                this many worker processes using
+                `concurrent.futures.ProcessPoolExecutor`. In this case the
+                evaluator must be picklable, and each worker has its own
+                cache. Work is handed out in contiguous chunks of similar cost
+                so that workers still benefit from their caches.
+
+        Returns:
+            A tuple with one `Die` per element of `generators_list`, in the
+            same order.
+        """
+        converted_list = [
+            _convert_generators(
+                generators if isinstance(generators, tuple) else (generators,))
+            for generators in generators_list
+        ]
+
+        unique = sorted(set(converted_list),
+                        key=lambda generators: self._estimate_cost(*generators)
+                        if generators else 0)
+
+        if max_workers is None:
+            unique_results = [
+                self.evaluate(*generators) for generators in unique
+            ]
+        else:
+            chunksize = max(1, len(unique) // (4 * max_workers))
+            # Don't send this evaluator's cache to every task.
+            evaluate_tuple = functools.partial(_evaluate_tuple,
+                                               _copy_without_cache(self))
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max_workers) as executor:
+                unique_results = list(
+                    executor.map(evaluate_tuple, unique, chunksize=chunksize))
+
+        results = dict(zip(unique, unique_results))
+        return tuple(results[generators] for generators in converted_list)
+
+    def _final_die(
+            self, dist: Mapping[Any, int],
+            generators: tuple[icepool.OutcomeCountGenerator,
+                              ...]) -> 'icepool.Die':
+        """Converts a distribution over final states to a `Die`."""
         final_outcomes = []
         final_weights = []
         for state, weight in dist.items():
-            outcome = self.final_outcome(state, *converted_generators)
+            outcome = self.final_outcome(state, *generators)
             if outcome is None:
                 raise TypeError(
                     "None is not a valid final outcome. "
@@ -275,15 +403,194 @@ class OutcomeCountEvaluator(ABC):
                 final_weights.append(weight)
 
         return icepool.Die(final_outcomes, final_weights,
-                           **self.final_kwargs(*converted_generators))
+                           **self.final_kwargs(*generators))
 
-    __call__ = evaluate
+    def evaluate_range(self, die, sizes: Iterable[int],
+                       /) -> tuple['icepool.Die', ...]:
+        """EXPERIMENTAL: Evaluates pools of a single `Die` for several pool sizes at once.
+
+        For example, `evaluator.evaluate_range(d6, range(1, 41))` is
+        equivalent to `tuple(evaluator.evaluate(d6.pool(n)) for n in range(1, 41))`,
+        but all sizes are computed in a single pass over the outcomes at
+        roughly the cost of the largest size alone.
+
+        This keeps one distribution over states for each possible number of
+        dice assigned so far. `next_state()` sees every outcome of the `Die`,
+        including those with zero count.
+
+        `order()`, `alignment()`, and `final_kwargs()` are determined using
+        the largest pool. `final_outcome()` is given the pool of the
+        corresponding size.
+
+        Args:
+            die: The `Die` to put in the pools.
+            sizes: The pool sizes to evaluate.
+
+        Returns:
+            A tuple with one `Die` per element of `sizes`, in the same order.
+
+        Raises:
+            ValueError: If any size is negative.
+        """
+        die = icepool.implicit_convert_to_die(die)
+        sizes = tuple(sizes)
+        if any(size < 0 for size in sizes):
+            raise ValueError('Pool sizes cannot be negative.')
+        if not sizes:
+            return ()
+        if die.is_empty():
+            return tuple(icepool.Die([]) for _ in sizes)
+
+        max_size = max(sizes)
+        max_pool = die.pool(max_size)
+
+        outcomes = set(die.outcomes())
+        outcomes.update(self.alignment(max_pool))
+        reverse = self.order(max_pool) == Order.Descending
+
+        # rows[assigned] is the distribution over states given that
+        # `assigned` dice have rolled the outcomes seen so far.
+        rows: Sequence[Mapping[Any, int]] = [{None: 1}] + [{}] * max_size
+        for outcome in sorted(outcomes, reverse=reverse):
+            quantity = die.quantity(outcome)
+            next_rows: list[MutableMapping[Any, int]] = [
+                defaultdict(int) for _ in range(max_size + 1)
+            ]
+            for assigned, row in enumerate(rows):
+                max_count = max_size - assigned if outcome in die else 0
+                for prev_state, prev_weight in row.items():
+                    for count in range(max_count + 1):
+                        state = self.next_state(prev_state, outcome, count)
+                        if state is icepool.Reroll:
+                            continue
+                        next_assigned = assigned + count
+                        weight = icepool.math.comb(next_assigned, count,
+                                                   quantity)
+                        next_rows[next_assigned][state] += prev_weight * weight
+            rows = next_rows
+
+        return tuple(
+            self._final_die(rows[size], (die.pool(size),)) for size in sizes)
+
+    def evaluate_deal_stream(self, cards: Iterable[tuple[Any, int]],
+                             *hand_sizes: int) -> 'icepool.Die':
+        """EXPERIMENTAL: Evaluates a deal from a sorted stream of cards.
+
+        This is equivalent to
+        `self.evaluate(icepool.Deck(dict(cards)).deal(*hand_sizes))`,
+        but `cards` is consumed lazily and no `Deck` or `Deal` is created.
+        Memory is proportional to the number of distinct
+        (state, remaining hand sizes) pairs rather than the size of the deck,
+        so `cards` may be e.g. a generator reading from a file.
+
+        Since there are no generators, `order()`, `alignment()`,
+        `final_outcome()`, and `final_kwargs()` are called without any.
+        In particular, `range_alignment()` produces nothing in this case; if
+        the evaluator needs to see outcomes that have no cards, include them
+        in `cards` with zero duplicates.
+
+        Args:
+            cards: An iterable of (card, duplicates) pairs, sorted strictly
+                ascending or strictly descending by card. This determines the
+                order in which `next_state()` sees outcomes.
+            *hand_sizes: How many cards to deal to each hand.
+
+        Raises:
+            ValueError: If the cards are not strictly sorted or are in the
+                opposite direction to a preferred `order()`, if any
+                duplicates or hand sizes are negative, or if there are not
+                enough cards to fill the hands.
+        """
+        if any(hand < 0 for hand in hand_sizes):
+            raise ValueError('hand_sizes cannot be negative.')
+
+        cards_iter = iter(cards)
+        head = list(itertools.islice(cards_iter, 2))
+        eval_order = self.order()
+        if len(head) == 2:
+            order = Order.Descending if head[1][0] < head[0][0] else Order.Ascending
+        elif eval_order == Order.Descending:
+            order = Order.Descending
+        else:
+            order = Order.Ascending
+        if eval_order != Order.Any and eval_order != order:
+            raise ValueError(
+                'The cards must be sorted in the order preferred by the evaluator.'
+            )
+
+        def precedes(a, b) -> bool:
+            return a < b if order == Order.Ascending else b < a
+
+        alignment = sorted(self.alignment(),
+                           reverse=order == Order.Descending)
+        alignment_index = 0
+
+        # Keyed by (state, remaining hand sizes).
+        dist: Mapping[tuple[Hashable, tuple[int, ...]], int] = {
+            (None, hand_sizes): 1
+        }
+        cards_seen = 0
+        prev_card = None
+        for card, dup in itertools.chain(head, cards_iter):
+            if dup < 0:
+                raise ValueError('Duplicates cannot be negative.')
+            if prev_card is not None and not precedes(prev_card, card):
+                raise ValueError('The cards must be strictly sorted.')
+            while alignment_index < len(alignment) and precedes(
+                    alignment[alignment_index], card):
+                dist = self._deal_stream_step(dist, alignment[alignment_index],
+                                              0)
+                alignment_index += 1
+            if alignment_index < len(alignment) and alignment[
+                    alignment_index] == card:
+                alignment_index += 1
+            dist = self._deal_stream_step(dist, card, dup)
+            cards_seen += dup
+            prev_card = card
+        for outcome in alignment[alignment_index:]:
+            dist = self._deal_stream_step(dist, outcome, 0)
+
+        if cards_seen < sum(hand_sizes):
+            raise ValueError(
+                'The total number of cards dealt cannot exceed the size of the deck.'
+            )
+
+        final_dist = {
+            state: weight
+            for (state, remaining), weight in dist.items()
+            if not any(remaining)
+        }
+        return self._final_die(final_dist, ())
+
+    def _deal_stream_step(
+            self, dist: Mapping[tuple[Hashable, tuple[int, ...]], int],
+            outcome, dup: int) -> Mapping[tuple[Hashable, tuple[int, ...]], int]:
+        """Deals the `dup` copies of `outcome` for `evaluate_deal_stream()`."""
+        next_dist: MutableMapping[tuple[Hashable, tuple[int, ...]],
+                                  int] = defaultdict(int)
+        for (prev_state, remaining), prev_weight in dist.items():
+            for count_total in range(min(dup, sum(remaining)) + 1):
+                weight_total = icepool.math.comb(dup, count_total)
+                for counts, weight_split in icepool.math.hypergeom_splits(
+                        remaining, count_total):
+                    state = self.next_state(prev_state, outcome, *counts)
+                    if state is icepool.Reroll:
+                        continue
+                    next_remaining = tuple(
+                        r - c for r, c in zip(remaining, counts))
+                    next_dist[state, next_remaining] += (
+                        prev_weight * weight_total * weight_split)
+        return next_dist
 
     def _select_algorithm(
             self, *generators: icepool.OutcomeCountGenerator
     ) -> tuple[Callable, Order]:
         """Selects an algorithm and iteration order.
 
+        The joint cost is the product of the generators' costs. A `Deal` costs
+        the same in both directions, so while its magnitude matters for
+        `max_cost`, it never changes which direction is chosen.
+
         Returns:
             * The algorithm to use (`_eval_internal*`).
             * The order in which `next_state()` sees outcomes.
@@ -291,11 +598,7 @@ class OutcomeCountEvaluator(ABC):
         """
         eval_order = self.order(*generators)
 
-        pop_min_costs, pop_max_costs = zip(
-            *(generator._estimate_order_costs() for generator in generators))
-
-        pop_min_cost = math.prod(pop_min_costs)
-        pop_max_cost = math.prod(pop_max_costs)
+        pop_min_cost, pop_max_cost = self._estimate_order_costs(*generators)
 
         # No preferred order case: go directly with cost.
         if eval_order == Order.Any:
@@ -322,6 +625,24 @@ class OutcomeCountEvaluator(ABC):
             # Use the less-preferred algorithm.
             return self._eval_internal_iterative, eval_order
 
+    @staticmethod
+    def _estimate_order_costs(
+            *generators: icepool.OutcomeCountGenerator) -> tuple[int, int]:
+        """Estimates the joint cost of popping from the min and max sides.
+
+        Returns:
+            pop_min_cost: A positive `int`.
+            pop_max_cost: A positive `int`.
+        """
+        pop_min_costs, pop_max_costs = zip(
+            *(generator._estimate_order_costs() for generator in generators))
+
+        return math.prod(pop_min_costs), math.prod(pop_max_costs)
+
+    def _estimate_cost(self, *generators: icepool.OutcomeCountGenerator) -> int:
+        """Estimates the cost of an exact evaluation in the cheaper order."""
+        return min(self._estimate_order_costs(*generators))
+
     def _eval_internal(
         self, order: int, alignment: Alignment,
         generators: tuple[icepool.OutcomeCountGenerator,
@@ -405,6 +726,53 @@ class OutcomeCountEvaluator(ABC):
             dist = next_dist
         return final_dist
 
+    def _eval_internal_symmetric_hands(
+        self, order: int, alignment: Alignment,
+        generators: tuple[icepool.OutcomeCountGenerator,
+                          ...]) -> Mapping[Any, int]:
+        """Internal algorithm for a single `Deal` whose hands are interchangeable.
+
+        This gives outcomes to `next_state()` in the given order, keeping a
+        distribution over (state, alignment, deal). After each outcome, the
+        hands are sorted by remaining size and state, and the state and deal
+        are permuted to match. See `symmetric_hands()`.
+
+        This algorithm does not perform persistent memoization.
+
+        Raises:
+            TypeError: If `generators` is not a single `Deal`.
+        """
+        if len(generators) != 1 or not isinstance(generators[0],
+                                                  icepool.Deal):
+            raise TypeError('symmetric_hands() requires a single Deal.')
+        if all(not generator.outcomes()
+               for generator in generators) and not alignment.outcomes():
+            return {None: 1}
+        dist: MutableMapping[Any, int] = defaultdict(int)
+        dist[None, alignment, generators] = 1
+        final_dist: MutableMapping[Any, int] = defaultdict(int)
+        while dist:
+            next_dist: MutableMapping[Any, int] = defaultdict(int)
+            for (prev_state, prev_alignment,
+                 prev_generators), weight in dist.items():
+                outcome, alignment, iterators = OutcomeCountEvaluator._pop_generators(
+                    -order, prev_alignment, prev_generators)
+                for deal, counts, count_weight in iterators[0]:
+                    if not isinstance(deal, icepool.Deal):
+                        raise TypeError(
+                            'symmetric_hands() requires a single Deal.')
+                    state = self.next_state(prev_state, outcome, *counts)
+                    if state is icepool.Reroll:
+                        continue
+                    state, deal = _canonicalize_hands(state, deal)
+                    if not deal.outcomes():
+                        final_dist[state] += weight * count_weight
+                    else:
+                        next_dist[state, alignment,
+                                  (deal,)] += weight * count_weight
+            dist = next_dist
+        return final_dist
+
     @staticmethod
     def _pop_generators(
         side: int, alignment: Alignment,
@@ -440,16 +808,197 @@ class OutcomeCountEvaluator(ABC):
     def sample(self, *generators: icepool.OutcomeCountGenerator |
                Mapping[Any, int] | Sequence):
         """EXPERIMENTAL: Samples one result from the generator(s) and evaluates the result."""
-        # Convert non-`Pool` arguments to `Pool`.
-        converted_generators = tuple(
-            generator if isinstance(generator, icepool.OutcomeCountGenerator
-                                   ) else icepool.Pool(generator)
-            for generator in generators)
+        converted_generators = _convert_generators(generators)
 
-        result = self.evaluate(*itertools.chain.from_iterable(
-            generator.sample() for generator in converted_generators))
+        result = self._evaluate_sample(
+            converted_generators,
+            tuple(
+                itertools.chain.from_iterable(
+                    generator.sample() for generator in converted_generators)))
 
-        if not result.is_empty():
-            return result.outcomes()[0]
+        if result is icepool.Reroll:
+            return icepool.Die([])
         else:
             return result
+
+    def sample_many(self,
+                    *generators: icepool.OutcomeCountGenerator |
+                    Mapping[Any, int] | Sequence,
+                    n: int,
+                    rng=None) -> 'icepool.Die':
+        """EXPERIMENTAL: Samples `n` results from the generator(s) and evaluates them.
+
+        This requires `numpy`.
+
+        The samples are drawn using `OutcomeCountGenerator.sample_many()`.
+        Each distinct sample is evaluated only once, by feeding its outcomes
+        directly to `next_state()` rather than through `evaluate()`.
+
+        Args:
+            *generators: As `evaluate()`.
+            n: The number of samples to draw.
+            rng: Anything accepted by `numpy.random.default_rng()`, such as a
+                `numpy.random.Generator` or an `int` seed. If omitted, fresh
+                entropy is used.
+
+        Returns:
+            A `Die` whose quantities are the number of times each final
+            outcome was produced. Samples that resulted in `icepool.Reroll` are
+            excluded, so the denominator may be less than `n`.
+        """
+        import numpy
+
+        converted_generators = _convert_generators(generators)
+        rng = numpy.random.default_rng(rng)
+
+        if len(converted_generators) == 1:
+            joint_samples = converted_generators[0].sample_many(n, rng=rng)
+        else:
+            # Pair up the samples of each generator in a random order.
+            sample_lists = []
+            for generator in converted_generators:
+                samples = list(
+                    generator.sample_many(n, rng=rng).elements())
+                sample_lists.append(
+                    [samples[i] for i in rng.permutation(n).tolist()])
+            joint_samples = Counter(
+                tuple(itertools.chain.from_iterable(joint_sample))
+                for joint_sample in zip(*sample_lists))
+
+        final_outcomes = []
+        final_quantities = []
+        for joint_sample, frequency in joint_samples.items():
+            outcome = self._evaluate_sample(converted_generators, joint_sample)
+            if outcome is not icepool.Reroll:
+                final_outcomes.append(outcome)
+                final_quantities.append(frequency)
+
+        return icepool.Die(final_outcomes, final_quantities,
+                           **self.final_kwargs(*converted_generators))
+
+    def estimate(
+        self,
+        *generators: icepool.OutcomeCountGenerator | Mapping[Any, int] |
+        Sequence,
+        samples: int = DEFAULT_ESTIMATE_SAMPLES,
+        rng=None,
+        confidence: float = 0.95
+    ) -> tuple['icepool.Die', Mapping[Any, tuple[float, float]]]:
+        """EXPERIMENTAL: Approximates `evaluate()` by Monte Carlo sampling.
+
+        This is useful when exact evaluation would be too expensive.
+        This requires `numpy`.
+
+        Args:
+            *generators: As `evaluate()`.
+            samples: The number of samples to draw.
+            rng: Anything accepted by `numpy.random.default_rng()`, such as a
+                `numpy.random.Generator` or an `int` seed. If omitted, fresh
+                entropy is used.
+            confidence: The confidence level of the intervals.
+
+        Returns:
+            * A `Die` whose quantities are the number of times each final
+                outcome was produced. See `sample_many()`.
+            * A mapping from each outcome of that `Die` to a
+                `(low, high)` interval for its probability, computed as the
+                Wilson score interval. Outcomes that were never sampled are not
+                included.
+        """
+        result = self.sample_many(*generators, n=samples, rng=rng)
+        if result.is_empty():
+            return result, {}
+
+        z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+        intervals = {
+            outcome: icepool.math.wilson_interval(quantity,
+                                                  result.denominator(), z)
+            for outcome, quantity in result.items()
+        }
+        return result, intervals
+
+    def _evaluate_sample(self,
+                         generators: tuple[icepool.OutcomeCountGenerator, ...],
+                         sample: tuple[tuple, ...]) -> Any:
+        """Evaluates a single sample of the generators.
+
+        Args:
+            generators: The generators the sample was drawn from.
+                These are given to `order()`, `alignment()`, and
+                `final_outcome()`.
+            sample: A sorted tuple of outcomes for each output of the
+                generators, as `OutcomeCountGenerator.sample()`.
+
+        Returns:
+            The final outcome, or `icepool.Reroll`.
+        """
+        sample_counts = tuple(Counter(x) for x in sample)
+        outcomes = set(self.alignment(*generators))
+        for counts in sample_counts:
+            outcomes.update(counts.keys())
+
+        reverse = self.order(*generators) == Order.Descending
+        state = None
+        for outcome in sorted(outcomes, reverse=reverse):
+            state = self.next_state(state, outcome,
+                                    *(counts[outcome]
+                                      for counts in sample_counts))
+            if state is icepool.Reroll:
+                return icepool.Reroll
+
+        outcome = self.final_outcome(state, *generators)
+        if outcome is None:
+            raise TypeError('None is not a valid final outcome.')
+        return outcome
+
+
+def _canonicalize_hands(
+        state: Hashable,
+        deal: 'icepool.Deal') -> tuple[tuple, 'icepool.Deal']:
+    """Reorders the hands of a state and `Deal` into a canonical order.
+
+    Hands are sorted by their remaining size, then by the hash of their
+    element of the state. The order among distinct hands with equal keys is
+    arbitrary, which can only miss some merges, not produce incorrect results.
+
+    Raises:
+        ValueError: If the state is not a tuple with one element per hand.
+    """
+    hand_sizes = deal.hand_sizes()
+    if not isinstance(state, tuple) or len(state) != len(hand_sizes):
+        raise ValueError(
+            'When symmetric_hands() is True, states must be tuples with one element per hand.'
+        )
+    permutation = sorted(range(len(state)),
+                         key=lambda i: (hand_sizes[i], hash(state[i])))
+    return tuple(state[i] for i in permutation), icepool.Deal(
+        deal.deck(), *(hand_sizes[i] for i in permutation))
+
+
+def _convert_generators(
+    generators: Sequence[icepool.OutcomeCountGenerator | Mapping[Any, int] |
+                         Sequence]
+) -> tuple[icepool.OutcomeCountGenerator, ...]:
+    """Converts non-`OutcomeCountGenerator` arguments to `Pool`."""
+    return tuple(
+        generator if isinstance(generator, icepool.OutcomeCountGenerator
+                               ) else icepool.Pool(generator)
+        for generator in generators)
+
+
+def _copy_without_cache(
+        evaluator: OutcomeCountEvaluator) -> OutcomeCountEvaluator:
+    """A shallow copy of `evaluator` with an empty cache."""
+    result = copy.copy(evaluator)
+    result.__dict__.pop('_cache', None)
+    return result
+
+
+def _evaluate_tuple(
+        evaluator: OutcomeCountEvaluator,
+        generators: tuple[icepool.OutcomeCountGenerator, ...]) -> 'icepool.Die':
+    """As `evaluator.evaluate()`, but taking a single tuple argument.
+
+    This is module-level so that it can be pickled for worker processes.
+    """
+    return evaluator.evaluate(*generators)
@@ -3,6 +3,7 @@ __docformat__ = 'google'
 import icepool
 
 import bisect
+from collections import Counter
 import itertools
 import random
 
@@ -11,8 +12,12 @@ from abc import ABC, abstractmethod
 from typing import Any, Callable, Collection, Container, Generator, Mapping, Sequence, TypeAlias, TypeVar
 
 NextOutcomeCountGenerator: TypeAlias = Generator[tuple[
-    'icepool.OutcomeCountGenerator', Sequence[int], int], None, None]
-"""The generator type returned by `_generate_min` and `_generate_max`."""
+    'icepool.OutcomeCountGenerator', Sequence[Any], int], None, None]
+"""The generator type returned by `_generate_min` and `_generate_max`.
+
+The counts are usually `int`s, but meta-generators such as `SuitGenerator` may
+yield other values.
+"""
 
 
 class OutcomeCountGenerator(ABC):
@@ -85,6 +90,15 @@ class OutcomeCountGenerator(ABC):
             pop_max_cost: A positive `int`.
         """
 
+    def _estimate_sample_order_costs(self) -> tuple[int, int]:
+        """As `_estimate_order_costs()`, but only used to choose a direction in `sample()`.
+
+        `sample()` calls this on every popped generator, so subclasses whose
+        directions always cost the same may override this with a cheaper
+        estimate.
+        """
+        return self._estimate_order_costs()
+
     @abstractmethod
     def denominator(self) -> int:
         """The total weight of all paths through this generator."""
@@ -203,10 +217,19 @@ class OutcomeCountGenerator(ABC):
         Returns:
             A sorted tuple of outcomes for each output of this generator.
         """
+        return self._sample(random)
+
+    def _sample(self, source) -> tuple[tuple, ...]:
+        """Implementation of `sample()`.
+
+        Args:
+            source: Any object with a `randrange()` method, such as the
+                `random` module or an instance of `random.Random`.
+        """
         if not self.outcomes():
             raise ValueError('Cannot sample from an empty set of outcomes.')
 
-        min_cost, max_cost = self._estimate_order_costs()
+        min_cost, max_cost = self._estimate_sample_order_costs()
 
         if min_cost < max_cost:
             outcome = self.min_outcome()
@@ -219,12 +242,44 @@ class OutcomeCountGenerator(ABC):
             itertools.accumulate(g.denominator() * w for g, _, w in generated))
         denominator = cumulative_weights[-1]
         # We don't use random.choices since that is based on floats rather than ints.
-        r = random.randrange(denominator)
+        r = source.randrange(denominator)
         index = bisect.bisect_right(cumulative_weights, r)
         popped_generator, counts, _ = generated[index]
         head = tuple((outcome,) * count for count in counts)
         if popped_generator.outcomes():
-            tail = popped_generator.sample()
+            tail = popped_generator._sample(source)
             return tuple(tuple(sorted(h + t)) for h, t, in zip(head, tail))
         else:
             return head
+
+    def sample_many(self,
+                    n: int,
+                    /,
+                    *,
+                    rng=None) -> 'Counter[tuple[tuple, ...]]':
+        """EXPERIMENTAL: Draws `n` independent random samples from this generator.
+
+        This requires `numpy`.
+
+        Subclasses may override this with a vectorized implementation.
+        The default implementation seeds a `random.Random` from `rng` and
+        draws the samples one at a time as `sample()`.
+
+        Args:
+            n: The number of samples to draw.
+            rng: Anything accepted by `numpy.random.default_rng()`, such as a
+                `numpy.random.Generator` or an `int` seed. If omitted, fresh
+                entropy is used.
+
+        Returns:
+            A `Counter` mapping each distinct sample, in the same format as
+            `sample()`, to the number of times it was drawn.
+        """
+        import numpy
+
+        if not self.outcomes():
+            raise ValueError('Cannot sample from an empty set of outcomes.')
+
+        rng = numpy.random.default_rng(rng)
+        source = random.Random(int(rng.integers(2**63)))
+        return Counter(self._sample(source) for _ in range(n))
@@ -7,9 +7,10 @@ import icepool.creation_args
 from icepool.counts import Counts
 from icepool.outcome_count_generator import NextOutcomeCountGenerator, OutcomeCountGenerator
 
+import bisect
 import itertools
 import math
-from collections import defaultdict
+from collections import Counter, defaultdict
 from functools import cache, cached_property
 
 from typing import Any, Collection, Generator, Mapping, MutableMapping, Sequence
@@ -392,6 +393,9 @@ class Pool(OutcomeCountGenerator):
 
         start = min(drop, self.size())
         stop = min(keep + drop, self.size())
+        if len(self._dice) == 1:
+            die, rolls = self._dice[0]
+            return die._keep(rolls, start, stop)
         return self[start:stop].sum()  # type: ignore
 
     def highest(self, keep: int = 1, drop: int = 0) -> 'icepool.Die':
@@ -411,13 +415,80 @@ class Pool(OutcomeCountGenerator):
 
         start = self.size() - min(keep + drop, self.size())
         stop = self.size() - min(drop, self.size())
+        if len(self._dice) == 1:
+            die, rolls = self._dice[0]
+            return die._keep(rolls, start, stop)
         return self[start:stop].sum()  # type: ignore
 
+    def sample_many(self,
+                    n: int,
+                    /,
+                    *,
+                    rng=None) -> 'Counter[tuple[tuple, ...]]':
+        """EXPERIMENTAL: Draws `n` independent random samples from this pool.
+
+        This requires `numpy`. All `n` rolls of each type of `Die` are drawn
+        at once as arrays of outcome indexes, which are then sorted and
+        counted without going through the recursive `sample()`.
+
+        Args:
+            n: The number of samples to draw.
+            rng: Anything accepted by `numpy.random.default_rng()`, such as a
+                `numpy.random.Generator` or an `int` seed. If omitted, fresh
+                entropy is used.
+
+        Returns:
+            A `Counter` mapping each distinct sample, in the same format as
+            `sample()`, to the number of times it was drawn.
+        """
+        import numpy
+
+        if not self.outcomes() or not self._is_resolvable():
+            raise ValueError('Cannot sample from an empty set of outcomes.')
+
+        rng = numpy.random.default_rng(rng)
+
+        if any(die.denominator() >= 2**63 for die, _ in self._dice):
+            # Too large for numpy integers.
+            return super().sample_many(n, rng=rng)
+
+        outcomes = self.outcomes()
+        columns = []
+        for die, count in self._dice:
+            # Maps outcome indexes of the die to outcome indexes of the pool.
+            outcome_indexes = numpy.array(
+                [bisect.bisect_left(outcomes, x) for x in die.outcomes()])
+            r = rng.integers(die.denominator(), size=(n, count))
+            die_indexes = numpy.searchsorted(die.quantities_le(),
+                                             r,
+                                             side='right')
+            columns.append(outcome_indexes[die_indexes])
+        rolls = numpy.sort(numpy.concatenate(columns, axis=1), axis=1)
+        rolls = numpy.repeat(rolls,
+                             [max(x, 0) for x in self.sorted_roll_counts()],
+                             axis=1)
+
+        if rolls.shape[1] == 0:
+            return Counter({((),): n})
+
+        unique_rolls, frequencies = numpy.unique(rolls,
+                                                 axis=0,
+                                                 return_counts=True)
+        return Counter({
+            (tuple(outcomes[i] for i in row),): frequency
+            for row, frequency in zip(unique_rolls.tolist(),
+                                      frequencies.tolist())
+        })
+
     def __str__(self) -> str:
         return (
             f'Pool of {self.size()} dice with sorted_roll_counts={self.sorted_roll_counts()}\n'
             + ''.join(f'  {repr(die)}\n' for die in self._dice_tuple))
 
+    def __reduce__(self):
+        return Pool._new_pool_from_tuple, (self._dice,
+                                           self._sorted_roll_counts)
+
     @cached_property
     def _key_tuple(self) -> tuple:
         return Pool, self._dice, self._sorted_roll_counts
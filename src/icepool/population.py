@@ -2,10 +2,12 @@ __docformat__ = 'google'
 
 from collections import defaultdict
 import icepool
+import icepool.elementwise
 from icepool.counts import CountsKeysView, CountsValuesView, CountsItemsView
 
 from abc import ABC, abstractmethod
 import bisect
+from fractions import Fraction
 from functools import cached_property
 import itertools
 import math
@@ -18,6 +20,23 @@ P = TypeVar('P', bound='Population')
 """Type variable representing a subclass of `Population`."""
 
 
+def _quantities_to_float_array(quantities: Sequence[int], denominator: int):
+    """Divides `int` quantities by `denominator`, producing a `numpy` `float64` array.
+
+    If the denominator is at most `2**53`, the quantities and denominator are
+    exactly representable as `float64`, so the division is done by `numpy`.
+    Otherwise, each division is done on Python `int`s, which is correctly
+    rounded and does not overflow even if the denominator is beyond the range
+    of `float`.
+    """
+    import numpy
+
+    if denominator <= 2**53:
+        return numpy.array(quantities, dtype=numpy.int64) / denominator
+    return (numpy.array(quantities, dtype=object) / denominator).astype(
+        numpy.float64)
+
+
 class Population(ABC, Mapping[Any, int]):
     """A mapping from outcomes to `int` quantities.
 
@@ -190,13 +209,77 @@ class Population(ABC, Mapping[Any, int]):
             return 0
         return self.quantities_ge()[index]
 
+    def _count_outcomes_below(self, outcomes: Sequence,
+                              inclusive: bool) -> list[int]:
+        """For each of `outcomes`, the number of outcomes of `self` that are < it (or <= if `inclusive`).
+
+        This is computed in a single merged pass over the sorted queries.
+        """
+        own = self.outcomes()
+        result = [0] * len(outcomes)
+        j = 0
+        for i in sorted(range(len(outcomes)), key=outcomes.__getitem__):
+            outcome = outcomes[i]
+            if inclusive:
+                while j < len(own) and own[j] <= outcome:
+                    j += 1
+            else:
+                while j < len(own) and own[j] < outcome:
+                    j += 1
+            result[i] = j
+        return result
+
+    def quantities_le_at(self, outcomes: Sequence, /) -> tuple[int, ...]:
+        """The quantity <= each of the given outcomes, in the given order.
+
+        This is more efficient than calling `quantity_le()` for each outcome.
+        """
+        quantities_le = self.quantities_le()
+        return tuple(quantities_le[n - 1] if n > 0 else 0
+                     for n in self._count_outcomes_below(outcomes, True))
+
+    def quantities_lt_at(self, outcomes: Sequence, /) -> tuple[int, ...]:
+        """The quantity < each of the given outcomes, in the given order.
+
+        This is more efficient than calling `quantity_lt()` for each outcome.
+        """
+        quantities_le = self.quantities_le()
+        return tuple(quantities_le[n - 1] if n > 0 else 0
+                     for n in self._count_outcomes_below(outcomes, False))
+
+    def quantities_ge_at(self, outcomes: Sequence, /) -> tuple[int, ...]:
+        """The quantity >= each of the given outcomes, in the given order.
+
+        This is more efficient than calling `quantity_ge()` for each outcome.
+        """
+        quantities_ge = self.quantities_ge()
+        return tuple(quantities_ge[n] if n < len(self) else 0
+                     for n in self._count_outcomes_below(outcomes, False))
+
+    def quantities_gt_at(self, outcomes: Sequence, /) -> tuple[int, ...]:
+        """The quantity > each of the given outcomes, in the given order.
+
+        This is more efficient than calling `quantity_gt()` for each outcome.
+        """
+        quantities_ge = self.quantities_ge()
+        return tuple(quantities_ge[n] if n < len(self) else 0
+                     for n in self._count_outcomes_below(outcomes, True))
+
     # Probabilities.
 
     @cached_property
     def _probabilities(self):
         return tuple(v / self.denominator() for v in self.values())
 
-    def probabilities(self, percent: bool = False):
+    @cached_property
+    def _probabilities_percent(self):
+        return tuple(100.0 * x for x in self._probabilities)
+
+    @cached_property
+    def _probabilities_exact(self) -> tuple[Fraction, ...]:
+        return tuple(Fraction(v, self.denominator()) for v in self.values())
+
+    def probabilities(self, percent: bool = False, exact: bool = False):
         """The probability of each outcome in order.
 
         Also known as the probability mass function (PMF).
@@ -204,9 +287,12 @@ class Population(ABC, Mapping[Any, int]):
         Args:
             percent: If set, the results will be in percent (i.e. total of 100.0).
                 Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
         """
+        if exact:
+            return self._exact_percent(self._probabilities_exact, percent)
         if percent:
-            return tuple(100.0 * x for x in self._probabilities)
+            return self._probabilities_percent
         else:
             return self._probabilities
 
@@ -215,7 +301,17 @@ class Population(ABC, Mapping[Any, int]):
         return tuple(
             quantity / self.denominator() for quantity in self.quantities_le())
 
-    def probabilities_le(self, percent: bool = False):
+    @cached_property
+    def _probabilities_le_percent(self):
+        return tuple(100.0 * x for x in self._probabilities_le)
+
+    @cached_property
+    def _probabilities_le_exact(self) -> tuple[Fraction, ...]:
+        return tuple(
+            Fraction(quantity, self.denominator())
+            for quantity in self.quantities_le())
+
+    def probabilities_le(self, percent: bool = False, exact: bool = False):
         """The probability of rolling <= each outcome in order.
 
         Also known as the cumulative distribution function (CDF),
@@ -224,9 +320,12 @@ class Population(ABC, Mapping[Any, int]):
         Args:
             percent: If set, the results will be in percent (i.e. total of 100.0).
                 Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
         """
+        if exact:
+            return self._exact_percent(self._probabilities_le_exact, percent)
         if percent:
-            return tuple(100.0 * x for x in self._probabilities_le)
+            return self._probabilities_le_percent
         else:
             return self._probabilities_le
 
@@ -235,7 +334,17 @@ class Population(ABC, Mapping[Any, int]):
         return tuple(
             quantity / self.denominator() for quantity in self.quantities_ge())
 
-    def probabilities_ge(self, percent: bool = False):
+    @cached_property
+    def _probabilities_ge_percent(self):
+        return tuple(100.0 * x for x in self._probabilities_ge)
+
+    @cached_property
+    def _probabilities_ge_exact(self) -> tuple[Fraction, ...]:
+        return tuple(
+            Fraction(quantity, self.denominator())
+            for quantity in self.quantities_ge())
+
+    def probabilities_ge(self, percent: bool = False, exact: bool = False):
         """The probability of rolling >= each outcome in order.
 
         Also known as the survival function (SF) or
@@ -245,16 +354,178 @@ class Population(ABC, Mapping[Any, int]):
         Args:
             percent: If set, the results will be in percent (i.e. total of 100.0).
                 Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
         """
+        if exact:
+            return self._exact_percent(self._probabilities_ge_exact, percent)
         if percent:
-            return tuple(100.0 * x for x in self._probabilities_ge)
+            return self._probabilities_ge_percent
         else:
             return self._probabilities_ge
 
-    def probability(self, outcome):
-        """The probability of a single outcome, or 0.0 if not present. """
+    @cached_property
+    def _probability_arrays(self) -> MutableMapping[tuple[str, bool], Any]:
+        return {}
+
+    def _probability_array(self, kind: str, percent: bool):
+        """A cached read-only `numpy` array of probabilities.
+
+        Args:
+            kind: One of `'pmf', 'le', 'ge'`.
+            percent: Whether the array is in percent.
+        """
+        key = (kind, percent)
+        if key not in self._probability_arrays:
+            if percent:
+                result = 100.0 * self._probability_array(kind, False)
+            else:
+                if kind == 'pmf':
+                    quantities: Sequence[int] = self.quantities()
+                elif kind == 'le':
+                    quantities = self.quantities_le()
+                else:
+                    quantities = self.quantities_ge()
+                result = _quantities_to_float_array(quantities,
+                                                    self.denominator())
+            result.flags.writeable = False
+            self._probability_arrays[key] = result
+        return self._probability_arrays[key]
+
+    def probabilities_array(self, percent: bool = False):
+        """As `probabilities()`, but as a read-only `numpy` array.
+
+        This requires `numpy`. The array is computed once and cached.
+
+        Args:
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+        """
+        return self._probability_array('pmf', percent)
+
+    def probabilities_le_array(self, percent: bool = False):
+        """As `probabilities_le()`, but as a read-only `numpy` array.
+
+        This requires `numpy`. The array is computed once and cached.
+
+        Args:
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+        """
+        return self._probability_array('le', percent)
+
+    def probabilities_ge_array(self, percent: bool = False):
+        """As `probabilities_ge()`, but as a read-only `numpy` array.
+
+        This requires `numpy`. The array is computed once and cached.
+
+        Args:
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+        """
+        return self._probability_array('ge', percent)
+
+    @staticmethod
+    def _exact_percent(probabilities: tuple[Fraction, ...],
+                       percent: bool) -> tuple[Fraction, ...]:
+        if percent:
+            return tuple(100 * x for x in probabilities)
+        else:
+            return probabilities
+
+    def probability(self, outcome, exact: bool = False):
+        """The probability of a single outcome, or 0.0 if not present.
+
+        Args:
+            outcome: The outcome to query.
+            exact: If set, the result will be a `Fraction` rather than a
+                `float`.
+        """
+        if exact:
+            return Fraction(self.quantity(outcome), self.denominator())
         return self.quantity(outcome) / self.denominator()
 
+    def _quantities_to_probabilities(self, quantities: Sequence[int],
+                                     percent: bool, exact: bool) -> tuple:
+        if exact:
+            scale = 100 if percent else 1
+            return tuple(
+                Fraction(scale * q, self.denominator()) for q in quantities)
+        if percent:
+            return tuple(100.0 * q / self.denominator() for q in quantities)
+        else:
+            return tuple(q / self.denominator() for q in quantities)
+
+    def probabilities_le_at(self,
+                            outcomes: Sequence,
+                            /,
+                            percent: bool = False,
+                            exact: bool = False) -> tuple:
+        """The probability of rolling <= each of the given outcomes, in the given order.
+
+        Args:
+            outcomes: The outcomes to query. These need not be outcomes of
+                `self`.
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
+        """
+        return self._quantities_to_probabilities(
+            self.quantities_le_at(outcomes), percent, exact)
+
+    def probabilities_lt_at(self,
+                            outcomes: Sequence,
+                            /,
+                            percent: bool = False,
+                            exact: bool = False) -> tuple:
+        """The probability of rolling < each of the given outcomes, in the given order.
+
+        Args:
+            outcomes: The outcomes to query. These need not be outcomes of
+                `self`.
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
+        """
+        return self._quantities_to_probabilities(
+            self.quantities_lt_at(outcomes), percent, exact)
+
+    def probabilities_ge_at(self,
+                            outcomes: Sequence,
+                            /,
+                            percent: bool = False,
+                            exact: bool = False) -> tuple:
+        """The probability of rolling >= each of the given outcomes, in the given order.
+
+        For example, `die.probabilities_ge_at(range(1, 41))` gives the chance
+        of meeting each difficulty from 1 to 40.
+
+        Args:
+            outcomes: The outcomes to query. These need not be outcomes of
+                `self`.
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
+        """
+        return self._quantities_to_probabilities(
+            self.quantities_ge_at(outcomes), percent, exact)
+
+    def probabilities_gt_at(self,
+                            outcomes: Sequence,
+                            /,
+                            percent: bool = False,
+                            exact: bool = False) -> tuple:
+        """The probability of rolling > each of the given outcomes, in the given order.
+
+        Args:
+            outcomes: The outcomes to query. These need not be outcomes of
+                `self`.
+            percent: If set, the results will be in percent (i.e. total of 100.0).
+                Otherwise, the total will be 1.0.
+            exact: If set, the results will be `Fraction`s rather than `float`s.
+        """
+        return self._quantities_to_probabilities(
+            self.quantities_gt_at(outcomes), percent, exact)
+
     # Scalar statistics.
 
     def mode(self) -> tuple:
@@ -322,17 +593,169 @@ class Population(ABC, Mapping[Any, int]):
             return self.max_outcome()
         return self.outcomes()[index]
 
-    def mean(self):
-        return sum(outcome * quantity
-                   for outcome, quantity in self.items()) / self.denominator()
+    def _quantile_outcomes(self, targets: Sequence[int],
+                           right: bool) -> tuple:
+        """The outcomes at which `quantities_le()` reaches each target.
 
-    def variance(self):
-        """This is the population variance, not the sample variance."""
-        mean = self.mean()
-        mean_of_squares = sum(
-            quantity * outcome**2
-            for outcome, quantity in self.items()) / self.denominator()
-        return mean_of_squares - mean * mean
+        The targets are processed in sorted order, so that each bisection
+        only searches past the previous result.
+
+        Args:
+            targets: The cumulative quantities to search for.
+            right: If set, this finds the first outcome with cumulative
+                quantity > each target. Otherwise, >= each target.
+        """
+        quantities_le = self.quantities_le()
+        bisect_func = bisect.bisect_right if right else bisect.bisect_left
+        result: list[Any] = [None] * len(targets)
+        index = 0
+        for i in sorted(range(len(targets)), key=targets.__getitem__):
+            index = bisect_func(quantities_le, targets[i], lo=index)
+            if index >= len(self):
+                result[i] = self.max_outcome()
+            else:
+                result[i] = self.outcomes()[index]
+        return tuple(result)
+
+    def quantiles(self, ns: Sequence[int], d: int = 100) -> tuple:
+        """The outcomes `n / d` of the way through the CDF for each of `ns`, taking the mean in case of a tie.
+
+        This is more efficient than calling `quantile()` for each `n`.
+        For example, `die.quantiles(range(1, 100))` gives all percentiles.
+
+        This will fail if the outcomes do not support division;
+        in this case, use `quantiles_left` or `quantiles_right` instead.
+        """
+        return tuple((left + right) / 2 for left, right in zip(
+            self.quantiles_left(ns, d), self.quantiles_right(ns, d)))
+
+    def quantiles_left(self, ns: Sequence[int], d: int = 100) -> tuple:
+        """The outcomes `n / d` of the way through the CDF for each of `ns`, taking the lesser in case of a tie."""
+        denominator = self.denominator()
+        return self._quantile_outcomes(
+            [(n * denominator + d - 1) // d for n in ns], False)
+
+    def quantiles_right(self, ns: Sequence[int], d: int = 100) -> tuple:
+        """The outcomes `n / d` of the way through the CDF for each of `ns`, taking the greater in case of a tie."""
+        denominator = self.denominator()
+        return self._quantile_outcomes([n * denominator // d for n in ns],
+                                       True)
+
+    @cached_property
+    def _is_int(self) -> bool:
+        """Whether all outcomes are `int`s, in which case statistics are returned as `float`s."""
+        return all(isinstance(outcome, int) for outcome in self.outcomes())
+
+    @cached_property
+    def _is_rational(self) -> bool:
+        """Whether all outcomes are `int`s or `Fraction`s, in which case statistics can be computed exactly."""
+        return all(
+            isinstance(outcome, (int, Fraction)) for outcome in self.outcomes())
+
+    def _check_exact(self) -> None:
+        if not self._is_rational:
+            raise TypeError(
+                'Exact statistics require all outcomes to be int or Fraction.'
+            )
+
+    @cached_property
+    def _power_sums(self) -> tuple:
+        """The sums of `quantity * outcome**k` for `k = 0, 1, 2`.
+
+        These are computed in a single pass.
+        """
+        s0 = s1 = s2 = 0
+        for outcome, quantity in self.items():
+            x = quantity * outcome
+            s0 += quantity
+            s1 += x
+            s2 += x * outcome
+        return s0, s1, s2
+
+    @cached_property
+    def _higher_power_sums(self) -> tuple:
+        """The sums of `quantity * outcome**k` for `k = 3, 4`.
+
+        These are only needed by the higher moments, so the mean and variance
+        don't pay for them.
+        """
+        s3 = s4 = 0
+        for outcome, quantity in self.items():
+            x = quantity * outcome**3
+            s3 += x
+            s4 += x * outcome
+        return s3, s4
+
+    @cached_property
+    def _mean_and_variance(self) -> tuple:
+        """The mean and the 2nd central moment.
+
+        If all outcomes are `int`s or `Fraction`s, these are exact `Fraction`s,
+        each built with a single division of the power sums. Otherwise, the
+        variance is computed in a second pass around the mean, which avoids
+        catastrophic cancellation.
+        """
+        if self._is_rational:
+            d, s1, s2 = self._power_sums
+            return Fraction(s1, d), Fraction(d * s2 - s1 * s1, d * d)
+        d = self.denominator()
+        mean = sum(outcome * quantity
+                   for outcome, quantity in self.items()) / d
+        m2 = sum(quantity * (outcome - mean)**2
+                 for outcome, quantity in self.items())
+        return mean, m2 / d
+
+    @cached_property
+    def _higher_central_moments(self) -> tuple:
+        """The 3rd and 4th central moments.
+
+        These are computed in the same way as `_mean_and_variance`.
+        """
+        if self._is_rational:
+            d, s1, s2 = self._power_sums
+            s3, s4 = self._higher_power_sums
+            exact_m3 = Fraction(d * d * s3 - 3 * d * s1 * s2 + 2 * s1**3, d**3)
+            exact_m4 = Fraction(
+                d**3 * s4 - 4 * d * d * s1 * s3 + 6 * d * s1 * s1 * s2 -
+                3 * s1**4, d**4)
+            return exact_m3, exact_m4
+        d = self.denominator()
+        mean = self._mean_and_variance[0]
+        m3 = m4 = 0
+        for outcome, quantity in self.items():
+            x = quantity * (outcome - mean)**3
+            m3 += x
+            m4 += x * (outcome - mean)
+        return m3 / d, m4 / d
+
+    def mean(self, exact: bool = False):
+        """The mean.
+
+        Args:
+            exact: If set, the result will be a `Fraction`. This requires all
+                outcomes to be `int`s or `Fraction`s.
+        """
+        if exact:
+            self._check_exact()
+            return self._mean_and_variance[0]
+        if self._is_int:
+            d, s1 = self._power_sums[:2]
+            return s1 / d
+        return self._mean_and_variance[0]
+
+    def variance(self, exact: bool = False):
+        """This is the population variance, not the sample variance.
+
+        Args:
+            exact: If set, the result will be a `Fraction`. This requires all
+                outcomes to be `int`s or `Fraction`s.
+        """
+        if exact:
+            self._check_exact()
+            return self._mean_and_variance[1]
+        if self._is_int:
+            return float(self._mean_and_variance[1])
+        return self._mean_and_variance[1]
 
     def standard_deviation(self):
         return math.sqrt(self.variance())
@@ -340,6 +763,13 @@ class Population(ABC, Mapping[Any, int]):
     sd = standard_deviation
 
     def standardized_moment(self, k: int):
+        if k in (2, 3, 4):
+            m2 = self._mean_and_variance[1]
+            mk = m2 if k == 2 else self._higher_central_moments[int(k) - 3]
+            if self._is_rational:
+                m2 = float(m2)
+                mk = float(mk)
+            return mk / (math.sqrt(m2)**k)
         sd = self.standard_deviation()
         mean = self.mean()
         ev = sum(p * (outcome - mean)**k
@@ -347,10 +777,32 @@ class Population(ABC, Mapping[Any, int]):
         return ev / (sd**k)
 
     def skewness(self):
-        return self.standardized_moment(3.0)
+        return self.standardized_moment(3)
 
     def excess_kurtosis(self):
-        return self.standardized_moment(4.0) - 3.0
+        return self.standardized_moment(4) - 3.0
+
+    def summary(self) -> dict[str, Any]:
+        """All of the moment statistics together, computed from cached sums.
+
+        Returns:
+            A `dict` with the keys `'mean'`, `'variance'`,
+            `'standard_deviation'`, `'skewness'`, and `'excess_kurtosis'`.
+            `'skewness'` and `'excess_kurtosis'` are `nan` if the variance is
+            zero.
+        """
+        result: dict[str, Any] = {
+            'mean': self.mean(),
+            'variance': self.variance(),
+            'standard_deviation': self.standard_deviation(),
+        }
+        if self.variance() == 0:
+            result['skewness'] = math.nan
+            result['excess_kurtosis'] = math.nan
+        else:
+            result['skewness'] = self.skewness()
+            result['excess_kurtosis'] = self.excess_kurtosis()
+        return result
 
     # Joint statistics.
 
@@ -376,8 +828,33 @@ class Population(ABC, Mapping[Any, int]):
 
         def __getitem__(self, dims: int | slice, /) -> P | Sequence[P]:
             """Marginalizes the given dimensions."""
-            return self._population.unary_op_non_elementwise(
-                operator.getitem, dims)
+            population = self._population
+            if len(population) >= icepool.elementwise.VECTORIZE_MIN_SIZE and (
+                    population._int_tuple_array is not None):
+                vectorized = icepool.elementwise.vectorized_getitem(
+                    population._int_tuple_array, population.quantities(),
+                    dims)
+                if vectorized is not None:
+                    return population._new_from_vectorized(*vectorized)
+            return population.unary_op_non_elementwise(operator.getitem, dims)
+
+    @cached_property
+    def _int_tuple_array(self):
+        """The outcomes as a `numpy` array if they are tuples of `int`s, otherwise `None`.
+
+        See `icepool.elementwise.int_tuple_array()`.
+        """
+        return icepool.elementwise.int_tuple_array(self.outcomes())
+
+    def _new_from_vectorized(self: P, items: Sequence[tuple[Any, int]],
+                             array) -> P:
+        """Creates a population of the same type from the result of a vectorized operation.
+
+        Args:
+            items: The sorted `(outcome, quantity)` items.
+            array: The outcomes as a `numpy` array.
+        """
+        return self._new_type()(dict(items))
 
     @property
     def marginals(self: P) -> Sequence[P]:
@@ -400,15 +877,105 @@ class Population(ABC, Mapping[Any, int]):
             data[new_outcome] += quantity
         return self._new_type()(data)
 
-    def covariance(self, i: int, j: int):
-        mean_i = self.marginals[i].mean()
-        mean_j = self.marginals[j].mean()
-        return sum((outcome[i] - mean_i) * (outcome[j] - mean_j) * quantity
-                   for outcome, quantity in self.items()) / self.denominator()
+    @cached_property
+    def _marginals_are_int(self) -> bool:
+        n = len(self.marginals)
+        return all(
+            isinstance(outcome[i], int) for outcome in self.outcomes()
+            for i in range(n))
+
+    @cached_property
+    def _marginals_are_rational(self) -> bool:
+        n = len(self.marginals)
+        return all(
+            isinstance(outcome[i], (int, Fraction))
+            for outcome in self.outcomes() for i in range(n))
+
+    @cached_property
+    def _covariance_matrix(self) -> tuple[tuple, ...]:
+        """The covariance matrix of the marginals, computed in one pass.
+
+        If all elements are `int`s or `Fraction`s, the entries are exact
+        `Fraction`s computed from the raw cross sums.
+        """
+        n = len(self.marginals)
+        d = self.denominator()
+        if self._marginals_are_rational:
+            sums = [0] * n
+            cross_sums = [[0] * n for _ in range(n)]
+            for outcome, quantity in self.items():
+                for i in range(n):
+                    x = quantity * outcome[i]
+                    sums[i] += x
+                    row = cross_sums[i]
+                    for j in range(i, n):
+                        row[j] += x * outcome[j]
+            exact_result = [[Fraction(0)] * n for _ in range(n)]
+            for i in range(n):
+                for j in range(i, n):
+                    entry = Fraction(d * cross_sums[i][j] - sums[i] * sums[j],
+                                     d * d)
+                    exact_result[i][j] = exact_result[j][i] = entry
+            return tuple(tuple(row) for row in exact_result)
+
+        means = [
+            sum(outcome[i] * quantity for outcome, quantity in self.items()) /
+            d for i in range(n)
+        ]
+        result: list[list[Any]] = [[0] * n for _ in range(n)]
+        for outcome, quantity in self.items():
+            deviations = [outcome[i] - means[i] for i in range(n)]
+            for i in range(n):
+                x = quantity * deviations[i]
+                row = result[i]
+                for j in range(i, n):
+                    row[j] += x * deviations[j]
+        for i in range(n):
+            for j in range(i, n):
+                result[i][j] = result[j][i] = result[i][j] / d
+        return tuple(tuple(row) for row in result)
+
+    def covariance_matrix(self, exact: bool = False) -> tuple[tuple, ...]:
+        """The covariance matrix of the marginals as a tuple of rows.
+
+        This is computed once and cached.
+
+        Args:
+            exact: If set, the entries will be `Fraction`s. This requires all
+                elements of the outcomes to be `int`s or `Fraction`s.
+        """
+        if exact:
+            self._check_exact_marginals()
+        elif self._marginals_are_int:
+            return tuple(
+                tuple(float(x) for x in row)
+                for row in self._covariance_matrix)
+        return self._covariance_matrix
+
+    def covariance(self, i: int, j: int, exact: bool = False):
+        """The covariance between two marginals.
+
+        Args:
+            i, j: The indexes of the marginals.
+            exact: If set, the result will be a `Fraction`. This requires all
+                elements of the outcomes to be `int`s or `Fraction`s.
+        """
+        if exact:
+            self._check_exact_marginals()
+        elif self._marginals_are_int:
+            return float(self._covariance_matrix[i][j])
+        return self._covariance_matrix[i][j]
+
+    def _check_exact_marginals(self) -> None:
+        if not self._marginals_are_rational:
+            raise TypeError(
+                'Exact statistics require all elements of the outcomes to be int or Fraction.'
+            )
 
     def correlation(self, i: int, j: int):
-        sd_i = self.marginals[i].standard_deviation()
-        sd_j = self.marginals[j].standard_deviation()
+        matrix = self._covariance_matrix
+        sd_i = math.sqrt(matrix[i][i])
+        sd_j = math.sqrt(matrix[j][j])
         return self.covariance(i, j) / (sd_i * sd_j)
 
     def sample(self):
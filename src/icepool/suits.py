@@ -1,23 +1,60 @@
 __docformat__ = 'google'
 
 import icepool
-from icepool.outcome_count_generator import NextOutcomeCountGenerator, OutcomeCountGenerator
+from icepool.math import deal_splits
+from icepool.outcome_count_generator import OutcomeCountGenerator
 
-from collections import defaultdict
 from functools import cached_property
-from typing import Any, Sequence
+from typing import Any, Generator, Hashable, Mapping, Sequence, TypeAlias
+
+SuitCounts: TypeAlias = tuple[tuple[int, ...], ...]
+"""The counts yielded by `SuitGenerator`: for each count index, a tuple with one count per suit."""
+
+NextSuitGenerator: TypeAlias = Generator[tuple[OutcomeCountGenerator,
+                                               SuitCounts, int], None, None]
+"""The generator type returned by `SuitGenerator`'s `_generate_min` and `_generate_max`."""
 
 
 class SuitGenerator(OutcomeCountGenerator):
     """EXPERIMENTAL: A meta-generator that groups 2-tuple outcomes from a source generator.
 
     This wraps a generator whose outcomes are of the form `(face, suit)`,
-    and yields `outcomes` equal to `face` and `counts` that are mappings
-    from `suit` to the count of that face and suit.
+    and yields `outcomes` equal to `face` and `counts` that are tuples
+    with the count of that face for each suit, in the order given by
+    `suits()`.
+
+    Note that before version 0.21.0, the counts were instead mappings from
+    suit to count. Evaluators written against that format should index the
+    counts by position in `suits()` instead.
     """
 
-    def __init__(self, src: OutcomeCountGenerator):
+    _src: OutcomeCountGenerator
+    _suits: tuple
+
+    def __init__(self,
+                 src: OutcomeCountGenerator,
+                 suits: Sequence[Hashable] | None = None):
+        """Constructor.
+
+        Args:
+            src: The source generator, whose outcomes are `(face, suit)`.
+            suits: The order of suits in the counts. If not provided, this is
+                all suits of the source generator in order of first
+                appearance. Suits need not be orderable.
+        """
         self._src = src
+        if suits is None:
+            suits = tuple(
+                dict.fromkeys(outcome[1] for outcome in src.outcomes()))
+        self._suits = tuple(suits)
+
+    def suits(self) -> tuple:
+        """The suits in the order they appear in the counts."""
+        return self._suits
+
+    @cached_property
+    def _suit_index(self) -> Mapping[Any, int]:
+        return {suit: i for i, suit in enumerate(self._suits)}
 
     @cached_property
     def _outcomes(self) -> Sequence:
@@ -32,32 +69,123 @@ class SuitGenerator(OutcomeCountGenerator):
     def _is_resolvable(self) -> bool:
         return self._src._is_resolvable()
 
-    def _generate_min(self, min_outcome) -> NextOutcomeCountGenerator:
-        blank_counts: Sequence[defaultdict[Any, int]] = [
-            defaultdict(int) for _ in range(self.counts_len())
-        ]
-        for popped_src, counts, weights in _generate_min_internal(
-                min_outcome, self._src, blank_counts, 1):
-            yield SuitGenerator(popped_src), counts, weights
-
-    def _generate_max(self, max_outcome) -> NextOutcomeCountGenerator:
-        blank_counts: Sequence[defaultdict[Any, int]] = [
-            defaultdict(int) for _ in range(self.counts_len())
-        ]
-        for popped_src, counts, weights in _generate_max_internal(
-                max_outcome, self._src, blank_counts, 1):
-            yield SuitGenerator(popped_src), counts, weights
+    def _generate_min(self, min_outcome) -> NextSuitGenerator:
+        return self._generate_internal(-1, min_outcome)
+
+    def _generate_max(self, max_outcome) -> NextSuitGenerator:
+        return self._generate_internal(1, max_outcome)
+
+    def _generate_internal(self, side: int,
+                           face) -> NextSuitGenerator:
+        """Pops all outcomes of the given face from one side of the source.
+
+        Each branch records the `(suit_index, counts)` popped along the way,
+        and the per-suit count tuples are only built once the face is
+        exhausted.
+
+        Args:
+            side: -1 to pop from the min side, 1 to pop from the max side.
+            face: The face to pop.
+        """
+        if isinstance(self._src, icepool.Deal):
+            yield from self._generate_deal(side, face)
+            return
+        stack: list[tuple[OutcomeCountGenerator, tuple, int]] = [(self._src,
+                                                                   (), 1)]
+        while stack:
+            src, records, weight = stack.pop()
+            if src.outcomes():
+                src_outcome = src.min_outcome(
+                ) if side < 0 else src.max_outcome()
+            if not src.outcomes() or src_outcome[0] != face:
+                if records:
+                    yield SuitGenerator(src, self._suits), self._build_counts(
+                        records), weight
+                else:
+                    yield self, self._zero_counts, weight
+                continue
+            suit_index = self._suit_index[src_outcome[1]]
+            if side < 0:
+                generated = src._generate_min(src_outcome)
+            else:
+                generated = src._generate_max(src_outcome)
+            for sub_src, sub_counts, sub_weight in generated:
+                stack.append((sub_src, records + ((suit_index, sub_counts), ),
+                              weight * sub_weight))
+
+    def _generate_deal(self, side: int, face) -> NextSuitGenerator:
+        """Specialization of `_generate_internal()` for a `Deal` source.
+
+        All suits of the face are popped from the `Deck` together, and the
+        splits are computed on the hand sizes alone, so only one `Deal` is
+        created per branch.
+        """
+        deal: icepool.Deal = self._src  # type: ignore
+        deck = deal.deck()
+        # (suit_index, dup, deck size before popping this suit)
+        entries = []
+        while deck.outcomes():
+            if side < 0:
+                card = deck.min_outcome()
+                popped_deck, dup = deck._pop_min()
+            else:
+                card = deck.max_outcome()
+                popped_deck, dup = deck._pop_max()
+            if card[0] != face:
+                break
+            entries.append((self._suit_index[card[1]], dup, deck.size()))
+            deck = popped_deck
+        if not entries:
+            yield self, self._zero_counts, 1
+            return
+
+        # (remaining hand sizes, records, weight)
+        branches: list[tuple[tuple[int, ...], tuple,
+                             int]] = [(deal.hand_sizes(), (), 1)]
+        for suit_index, dup, deck_size in entries:
+            next_branches = []
+            for hand_sizes, records, weight in branches:
+                min_count = max(0, dup + sum(hand_sizes) - deck_size)
+                for counts, weight_split in deal_splits(
+                        hand_sizes, dup, min_count):
+                    next_branches.append(
+                        (tuple(h - c for h, c in zip(hand_sizes, counts)),
+                         records + ((suit_index, counts), ),
+                         weight * weight_split))
+            branches = next_branches
+
+        for hand_sizes, records, weight in branches:
+            yield SuitGenerator(icepool.Deal(deck, *hand_sizes),
+                                self._suits), self._build_counts(
+                                    records), weight
+
+    @cached_property
+    def _zero_counts(self) -> SuitCounts:
+        return ((0, ) * len(self._suits), ) * self.counts_len()
+
+    def _build_counts(self, records: tuple) -> SuitCounts:
+        """Converts `(suit_index, counts)` records into per-suit count tuples for each count index."""
+        result = []
+        for i in range(self.counts_len()):
+            suit_counts = [0] * len(self._suits)
+            for suit_index, sub_counts in records:
+                suit_counts[suit_index] = sub_counts[i]
+            result.append(tuple(suit_counts))
+        return tuple(result)
 
     def _estimate_order_costs(self) -> tuple[int, int]:
         # We might consider up-costing this.
         return self._src._estimate_order_costs()
 
+    def _estimate_sample_order_costs(self) -> tuple[int, int]:
+        return self._src._estimate_sample_order_costs()
+
     def denominator(self) -> int:
         return self._src.denominator()
 
     @cached_property
     def _key_tuple(self) -> tuple:
-        return SuitGenerator, self._src
+        return SuitGenerator, self._src, self._suits
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, SuitGenerator):
@@ -70,37 +198,3 @@ class SuitGenerator(OutcomeCountGenerator):
 
     def __hash__(self) -> int:
         return self._hash
-
-
-def _generate_min_internal(min_outcome, src: OutcomeCountGenerator,
-                           counts: Sequence[defaultdict[Any,
-                                                        int]], weight: int):
-    if not src.outcomes() or src.min_outcome()[0] != min_outcome:
-        yield src, counts, weight
-    else:
-        for sub_src, sub_counts, sub_weight in src._generate_min(
-                src.min_outcome()):
-            next_counts = []
-            for count, sub_count in zip(counts, sub_counts):
-                next_count = count.copy()
-                next_count[src.min_outcome()[1]] = sub_count
-                next_counts.append(next_count)
-            yield from _generate_min_internal(min_outcome, sub_src, next_counts,
-                                              weight * sub_weight)
-
-
-def _generate_max_internal(max_outcome, src: OutcomeCountGenerator,
-                           counts: Sequence[defaultdict[Any,
-                                                        int]], weight: int):
-    if not src.outcomes() or src.max_outcome()[0] != max_outcome:
-        yield src, counts, weight
-    else:
-        for sub_src, sub_counts, sub_weight in src._generate_max(
-                src.max_outcome()):
-            next_counts = []
-            for count, sub_count in zip(counts, sub_counts):
-                next_count = count.copy()
-                next_count[src.max_outcome()[1]] = sub_count
-                next_counts.append(next_count)
-            yield from _generate_max_internal(max_outcome, sub_src, next_counts,
-                                              weight * sub_weight)
@@ -1,4 +1,5 @@
 import icepool
+import operator
 import pytest
 
 from icepool import d6
@@ -65,3 +66,118 @@ def test_accumulate_initial():
                                      initial=icepool.d6):
         expected += icepool.d6
         assert result.equals(expected)
+
+
+def test_apply_vectorized():
+    pytest.importorskip('numpy')
+    result = icepool.apply(lambda a, b, c: a * b - c,
+                           d6,
+                           d6,
+                           icepool.d8,
+                           vectorized=True)
+    expected = icepool.apply(lambda a, b, c: a * b - c, d6, d6, icepool.d8)
+    assert result.equals(expected)
+
+
+def test_apply_vectorized_ufunc():
+    numpy = pytest.importorskip('numpy')
+    result = icepool.apply(numpy.maximum, d6, d6, vectorized=True)
+    expected = icepool.apply(max, d6, d6)
+    assert result.equals(expected)
+
+
+def test_apply_vectorized_big_quantities():
+    pytest.importorskip('numpy')
+    die = icepool.Die({1: 2**40, 2: 3})
+    result = icepool.apply(lambda a, b: a + b, die, die, vectorized=True)
+    assert result.equals(die + die)
+
+
+def test_apply_vectorized_non_number():
+    pytest.importorskip('numpy')
+    with pytest.raises(TypeError):
+        icepool.apply(lambda a: a, icepool.Die(['a', 'b']), vectorized=True)
+
+
+def test_apply_memoize():
+    calls = []
+
+    def func(a, b):
+        calls.append((a, b))
+        return a * b
+
+    first = icepool.apply(func, d6, d6, memoize=True)
+    second = icepool.apply(func, d6, d6, memoize=True)
+    assert first.equals(second)
+    assert len(calls) == 36
+
+
+def test_memoize_decorator():
+    calls = []
+
+    @icepool.memoize
+    def func(a):
+        calls.append(a)
+        return a + 1
+
+    icepool.apply(func, d6)
+    icepool.apply(func, icepool.d8)
+    assert len(calls) == 8
+    func.cache_clear()
+    icepool.apply(func, d6)
+    assert len(calls) == 14
+
+
+def test_memoize_typed():
+
+    @icepool.memoize
+    def func(a):
+        return type(a).__name__
+
+    assert func(1) == 'int'
+    assert func(True) == 'bool'
+    assert func(1.0) == 'float'
+
+
+def test_memoize_bounded():
+    calls = []
+
+    @icepool.memoize
+    def func(a):
+        calls.append(a)
+        return a
+
+    for i in range(icepool.die.func.MEMOIZE_CACHE_SIZE + 1):
+        func(i)
+    assert len(icepool.die.func._memoize_caches[
+        func.__wrapped__]) == icepool.die.func.MEMOIZE_CACHE_SIZE
+    # The least recently used result was evicted.
+    func(0)
+    assert len(calls) == icepool.die.func.MEMOIZE_CACHE_SIZE + 2
+
+
+def test_reduce_associative():
+    dice = [d6] * 13
+    result = icepool.reduce(operator.add, dice, associative=True)
+    expected = icepool.reduce(operator.add, dice)
+    assert result.equals(expected)
+
+
+def test_reduce_associative_order():
+    # Concatenation is associative but not commutative.
+    dice = [icepool.Die([(i, ), (i + 10, )]) for i in range(5)]
+    result = icepool.reduce(operator.add,
+                            dice,
+                            initial=icepool.Die([()]),
+                            associative=True)
+    expected = icepool.reduce(operator.add, dice, initial=icepool.Die([()]))
+    assert result.equals(expected)
+
+
+def test_reduce_associative_processes():
+    dice = [icepool.d4, d6, icepool.d8]
+    result = icepool.reduce(operator.add,
+                            dice,
+                            associative=True,
+                            max_workers=2)
+    assert result.equals(icepool.d4 + d6 + icepool.d8)
@@ -94,6 +94,19 @@ def test_truncate_skip():
     assert result.equals(expected)
 
 
+def test_truncate_empty():
+    result = icepool.d6.truncate(5, 2)
+    assert result.is_empty()
+
+
+def test_binary_op_die_outcome():
+    # Outcomes that are dice are still expanded by the Die constructor.
+    result = icepool.d2.binary_op(icepool.Die([0]),
+                                  lambda a, b: icepool.Die([a, 10]))
+    expected = icepool.Die([1, 10, 2, 10])
+    assert result.equals(expected)
+
+
 def test_abs_positive():
     result = icepool.d6.abs()
     expected = icepool.d6
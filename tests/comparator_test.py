@@ -1,6 +1,8 @@
 import icepool
 import pytest
 
+import operator
+
 
 def test_lt():
     result = icepool.d6 < icepool.d6
@@ -214,4 +216,38 @@ def test_highest():
 def test_lowest():
     result = icepool.lowest(icepool.d4 + 1, icepool.d6)
     expected = icepool.Die({1: 4, 2: 8, 3: 6, 4: 4, 5: 2})
-    assert result.equals(expected)
\ No newline at end of file
+    assert result.equals(expected)
+
+
+def test_probabilities_at():
+    die = icepool.Die([1, 2, 2, 4, 7])
+    thresholds = [8, 0, 2, 3, 7, 1, 5, 2]
+    assert die.probabilities_le_at(thresholds) == tuple(
+        (die <= t).mean() for t in thresholds)
+    assert die.probabilities_lt_at(thresholds) == tuple(
+        (die < t).mean() for t in thresholds)
+    assert die.probabilities_ge_at(thresholds) == tuple(
+        (die >= t).mean() for t in thresholds)
+    assert die.probabilities_gt_at(thresholds) == tuple(
+        (die > t).mean() for t in thresholds)
+
+
+def test_probabilities_at_percent():
+    result = icepool.d4.probabilities_ge_at(range(6), percent=True)
+    assert result == (100.0, 100.0, 75.0, 50.0, 25.0, 0.0)
+
+
+@pytest.mark.parametrize('op,func', [('<', operator.lt), ('<=', operator.le),
+                                     ('>=', operator.ge), ('>', operator.gt),
+                                     ('==', operator.eq), ('!=', operator.ne)])
+def test_compare_many(op, func):
+    die = 3 @ icepool.d6
+    others = [icepool.d20, 10, 3, icepool.Die([4, 12, 19]), 20, 0]
+    expected = tuple(
+        icepool.Die([func(die, other)]).probability(True) for other in others)
+    assert die.compare_many(op, others) == pytest.approx(expected)
+
+
+def test_compare_many_invalid_op():
+    with pytest.raises(ValueError):
+        icepool.d6.compare_many('<>', [1])
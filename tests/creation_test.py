@@ -72,3 +72,11 @@ def test_reroll_tuple():
 def test_denominator():
     result = icepool.Die([icepool.d(3), icepool.d(4), icepool.d(6)])
     assert result.denominator() == 36
+
+
+def test_subclass_construction():
+
+    class SubDie(icepool.Die):
+        pass
+
+    assert type(SubDie([1, 2, 3])) is SubDie
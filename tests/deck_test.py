@@ -1,4 +1,5 @@
 import icepool
+import icepool.math
 import pytest
 
 from icepool import BestStraightEvaluator
@@ -51,3 +52,121 @@ def test_two_hand_sum_diff_size():
 
     assert deal.denominator() == result.denominator()
     assert (result.marginals[0] * 2).mean() == result.marginals[1].mean()
+
+
+def test_three_hand_denominator():
+    deal = icepool.Deck({0: 3, 1: 2, 2: 2}).deal(2, 1, 2)
+    result = deal.evaluate(sum_each)
+    assert deal.denominator() == result.denominator()
+
+
+def test_hypergeom_splits():
+    result = icepool.math.hypergeom_splits((2, 3), 3)
+    assert result == (((0, 3), 1), ((1, 2), 3), ((2, 1), 3))
+
+
+def test_hypergeom_splits_full_deal():
+    # Splitting all cards among the hands gives a multinomial coefficient.
+    hand_sizes = (2, 2, 1, 3)
+    result = icepool.math.hypergeom_splits(hand_sizes, sum(hand_sizes))
+    assert sum(weight for _, weight in result) == 1680
+
+
+class SortedSumEach(icepool.OutcomeCountEvaluator):
+
+    def next_state(self, state, outcome, *counts):
+        return sum_each(state, outcome, *counts)
+
+    def final_outcome(self, final_state, *generators):
+        return tuple(sorted(final_state))
+
+
+class SymmetricSortedSumEach(SortedSumEach):
+
+    def symmetric_hands(self, *generators):
+        return True
+
+
+@pytest.mark.parametrize('hand_sizes', [(2, 2, 2), (3, 1, 3), (1, 2, 3, 2)])
+def test_symmetric_hands(hand_sizes):
+    deal = icepool.Deck(range(5), times=3).deal(*hand_sizes)
+    result = SymmetricSortedSumEach().evaluate(deal)
+    expected = SortedSumEach().evaluate(deal)
+    assert result.equals(expected)
+
+
+def test_symmetric_hands_bad_state():
+
+    class BadState(icepool.OutcomeCountEvaluator):
+
+        def next_state(self, state, outcome, *counts):
+            return 0
+
+        def symmetric_hands(self, *generators):
+            return True
+
+    with pytest.raises(ValueError):
+        BadState().evaluate(icepool.Deck(range(4)).deal(1, 1))
+
+
+def test_deck_pop_equals_fresh():
+    deck = icepool.Deck({0: 1, 1: 2, 2: 3, 3: 4})
+    popped, count = deck._pop_min()
+    assert count == 1
+    popped, count = popped._pop_max()
+    assert count == 4
+    fresh = icepool.Deck({1: 2, 2: 3})
+    assert popped == fresh
+    assert hash(popped) == hash(fresh)
+    assert popped.outcomes() == (1, 2)
+    assert popped.quantities()[-1] == 3
+    assert 0 not in popped
+    assert 3 not in popped
+
+
+def test_deck_pop_not_equal():
+    deck = icepool.Deck({0: 1, 1: 2, 2: 2, 3: 1})
+    assert deck._pop_min()[0] != deck._pop_max()[0]
+
+
+class SumEachAnyOrder(icepool.OutcomeCountEvaluator):
+
+    def next_state(self, state, outcome, *counts):
+        if state is None:
+            state = (0, ) * len(counts)
+        return tuple(x + outcome * count for x, count in zip(state, counts))
+
+    def order(self, *generators):
+        return icepool.Order.Any
+
+
+@pytest.mark.parametrize('hand_sizes', [(3, ), (2, 3), (1, 2, 2)])
+def test_deal_stream(hand_sizes):
+    deck = icepool.Deck({0: 3, 1: 2, 3: 4, 5: 1, 6: 2})
+    evaluator = SumEachAnyOrder()
+    expected = evaluator.evaluate(deck.deal(*hand_sizes))
+    ascending = evaluator.evaluate_deal_stream(
+        (item for item in deck.items()), *hand_sizes)
+    descending = evaluator.evaluate_deal_stream(reversed(deck.items()),
+                                                *hand_sizes)
+    assert ascending.equals(expected)
+    assert descending.equals(expected)
+
+
+def test_deal_stream_zero_dup_alignment():
+    cards = ((i, 0 if i == 5 else 4) for i in range(13))
+    result = best_run_evaluator.evaluate_deal_stream(cards, 5)
+    expected = best_run_evaluator.evaluate(
+        icepool.Deck({i: 4
+                      for i in range(13) if i != 5}).deal(5))
+    assert result.equals(expected)
+
+
+def test_deal_stream_unsorted():
+    with pytest.raises(ValueError):
+        SumEachAnyOrder().evaluate_deal_stream([(0, 1), (2, 1), (1, 1)], 2)
+
+
+def test_deal_stream_too_few_cards():
+    with pytest.raises(ValueError):
+        SumEachAnyOrder().evaluate_deal_stream([(0, 1), (1, 1)], 3)
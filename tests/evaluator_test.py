@@ -173,3 +173,58 @@ def test_contains_subset_vs_intersection_size():
     result_a = pool.contains_subset([1, 2, 3, 3])
     result_b = pool.intersection_size([1, 2, 3, 3]) == 4
     assert result_a == result_b
+
+
+def test_evaluate_range():
+    evaluator = icepool.SumEvaluator()
+    sizes = [3, 0, 5, 1]
+    result = evaluator.evaluate_range(d6, sizes)
+    for die, size in zip(result, sizes):
+        assert die.equals(evaluator.evaluate(d6.pool(size)))
+
+
+def test_evaluate_range_descending():
+    evaluator = SumPoolDescending()
+    result = evaluator.evaluate_range(d6, range(1, 5))
+    for die, size in zip(result, range(1, 5)):
+        assert die.equals(size @ d6)
+
+
+def test_evaluate_range_reroll():
+    evaluator = SumRerollIfAnyOnes()
+    result = evaluator.evaluate_range(d6, [2, 4])
+    assert result[0].equals(evaluator.evaluate(d6.pool(2)))
+    assert result[1].equals(evaluator.evaluate(d6.pool(4)))
+
+
+def test_evaluate_many():
+    evaluator = icepool.SumEvaluator()
+    generators_list = [
+        icepool.Pool([d8, d10]),
+        icepool.Pool([d12, d12, d8]),
+        (icepool.Pool([d8, d10]),),
+        [d10, d12],
+    ]
+    result = evaluator.evaluate_many(generators_list)
+    assert len(result) == 4
+    assert result[0].equals(d8 + d10)
+    assert result[1].equals(d12 + d12 + d8)
+    assert result[2].equals(d8 + d10)
+    assert result[3].equals(d10 + d12)
+
+
+def test_evaluate_many_processes():
+    evaluator = icepool.SumEvaluator()
+    generators_list = [d6.pool(n) for n in range(1, 5)]
+    result = evaluator.evaluate_many(generators_list, max_workers=2)
+    for die, n in zip(result, range(1, 5)):
+        assert die.equals(n @ d6)
+
+
+def test_evaluate_many_worker_copy_has_no_cache():
+    evaluator = icepool.SumEvaluator()
+    evaluator.evaluate(d6.pool(3))
+    assert evaluator._cache
+    copied = icepool.outcome_count_evaluator._copy_without_cache(evaluator)
+    assert not copied._cache
+    assert evaluator._cache
@@ -1,5 +1,9 @@
 import icepool
+import os
+import pickle
 import pytest
+import subprocess
+import sys
 
 
 def test_die():
@@ -21,3 +25,60 @@ def test_pool():
 def test_die_construct():
     die = icepool.Die({icepool.d3: 1, icepool.d3 + 3: 1})
     assert die == icepool.d6
+
+
+class PickleDie(icepool.Die):
+    pass
+
+
+def test_pickle_die_subclass():
+    die = PickleDie([1, 2, 2])
+    result = pickle.loads(pickle.dumps(die))
+    assert type(result) is PickleDie
+    assert result.equals(die)
+
+
+def test_pickle_die_with_truth():
+    die = icepool.d6 == icepool.d6
+    result = pickle.loads(pickle.dumps(die))
+    assert type(result) is icepool.Die
+    assert result.equals(icepool.Die(die))
+
+
+def test_pickle_counts_across_hash_seeds():
+    src = os.path.dirname(os.path.dirname(icepool.__file__))
+    script = """
+import icepool, pickle, sys
+if sys.argv[1] == 'dump':
+    deck = icepool.Deck(['a', 'b', 'c'])
+    hash(deck)
+    sys.stdout.buffer.write(pickle.dumps((deck, icepool.Die(['a', 'b']))))
+else:
+    deck, die = pickle.loads(sys.stdin.buffer.read())
+    assert deck == icepool.Deck(['a', 'b', 'c'])
+    assert die._data == icepool.Die(['a', 'b'])._data
+"""
+
+    def run(seed, arg, data=None):
+        env = dict(os.environ, PYTHONHASHSEED=str(seed), PYTHONPATH=src)
+        return subprocess.run([sys.executable, '-c', script, arg],
+                              input=data,
+                              capture_output=True,
+                              env=env,
+                              check=True).stdout
+
+    run(2, 'load', run(1, 'dump'))
+
+
+def test_pickle_counts_slice():
+    data = icepool.d6._data._slice(1, 3)
+    result = pickle.loads(pickle.dumps(data))
+    assert result == data
+    assert list(result.items()) == [(2, 1), (3, 1)]
+
+
+def test_counts_small_slice_copies_storage():
+    data = icepool.d20._data
+    assert data._slice(0, 15)._storage is data._storage
+    assert data._slice(0, 2)._storage is not data._storage
+    assert data._slice(0, 2) == icepool.d2._data
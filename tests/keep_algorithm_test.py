@@ -100,3 +100,11 @@ def test_pool_highest(dice, keep, drop):
 
     expected = icepool.apply(expected_highest, *dice)
     assert result.equals(expected)
+
+
+def test_keep_cache_bounded():
+    die = icepool.Die([1, 2, 3])
+    for rolls in range(1, icepool.die.die._KEEP_CACHE_SIZE + 10):
+        die._keep(rolls, 0, 1)
+    assert len(die._keep_cache) == icepool.die.die._KEEP_CACHE_SIZE
+    assert die._keep(1, 0, 1).equals(die)
@@ -132,3 +132,54 @@ def test_lowest():
     result = icepool.lowest(icepool.d6, icepool.d6)
     expected = icepool.d6.keep_lowest(2, 1)
     assert result.equals(expected)
+
+
+@pytest.mark.parametrize('keep', range(0, 6))
+@pytest.mark.parametrize('drop', range(0, 3))
+def test_keep_highest_matches_pool(keep, drop):
+    die = icepool.Die([1, 2, 2, 5])
+    result = die.keep_highest(4, keep, drop)
+    start = 4 - min(keep + drop, 4)
+    stop = 4 - min(drop, 4)
+    expected = die.pool(4)[start:stop].sum()
+    assert result.equals(expected)
+
+
+@pytest.mark.parametrize('keep', range(0, 6))
+@pytest.mark.parametrize('drop', range(0, 3))
+def test_keep_lowest_matches_pool(keep, drop):
+    die = icepool.Die([1, 2, 2, 5])
+    result = die.keep_lowest(4, keep, drop)
+    start = min(drop, 4)
+    stop = min(keep + drop, 4)
+    expected = die.pool(4)[start:stop].sum()
+    assert result.equals(expected)
+
+
+def test_pool_highest_single_type():
+    result = icepool.d8.pool(5).highest(2, drop=1)
+    expected = bf_keep_highest(icepool.d8, 5, 2, drop=1)
+    assert result.equals(expected)
+
+
+def test_keep_highest_large_pool():
+    result = icepool.d6.keep_highest(100, 3)
+    assert result.min_outcome() == 3
+    assert result.max_outcome() == 18
+    assert result.denominator() == 6**100
+
+
+@pytest.mark.parametrize('die', [
+    icepool.Die([(1, 2), (3, 4), (0, 5)]),
+    icepool.Die([0.1, 0.2, 0.7]),
+])
+def test_keep_highest_non_rational_matches_pool(die):
+    result = die.keep_highest(3, 2)
+    expected = die.pool(3)[1:3].sum()
+    assert result.equals(expected)
+
+
+def test_keep_many_matches_pool():
+    result = icepool.d10.keep_highest(12, 6, 2)
+    expected = icepool.d10.pool(12)[4:10].sum()
+    assert result.equals(expected)
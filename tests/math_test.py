@@ -0,0 +1,74 @@
+import icepool.math
+import math
+import pytest
+
+
+@pytest.mark.parametrize('b', [0, 1, 2, 5])
+def test_comb_row(b):
+    for n in range(20):
+        expected = tuple(math.comb(n, k) * b**k for k in range(n + 1))
+        assert icepool.math.comb_row(n, b) == expected
+
+
+def test_comb_row_uncached():
+    n = icepool.math.COMB_ROW_CACHE_MAX_N + 1
+    icepool.math.clear_comb_row_cache()
+    row = icepool.math.comb_row(n, 3)
+    assert row[2] == math.comb(n, 2) * 9
+    assert icepool.math.comb_row_cache_info().currsize == 0
+
+
+def test_comb_row_cache_bounded():
+    icepool.math.clear_comb_row_cache()
+    for b in range(icepool.math.COMB_ROW_CACHE_SIZE + 10):
+        icepool.math.comb_row(3, b)
+    info = icepool.math.comb_row_cache_info()
+    assert info.currsize == icepool.math.COMB_ROW_CACHE_SIZE
+
+
+def test_multinomial():
+    assert icepool.math.multinomial(3, 2, 1) == 60
+    assert icepool.math.multinomial(1, 2, 3) == 60
+    assert icepool.math.multinomial() == 1
+
+
+def test_factorial():
+    assert [icepool.math.factorial(n)
+            for n in range(10)] == [math.factorial(n) for n in range(10)]
+
+
+def test_clear_caches():
+    icepool.math.multinomial(4, 5, 6)
+    icepool.math.hypergeom_splits((2, 3), 3)
+    icepool.math.split_pair_counts((2, 3))
+    icepool.math.clear_caches()
+    assert icepool.math._multinomial.cache_info().currsize == 0
+    assert icepool.math.hypergeom_splits.cache_info().currsize == 0
+    assert icepool.math.split_pair_counts.cache_info().currsize == 0
+    assert icepool.math.comb_row_cache_info().currsize == 0
+
+
+def test_hypergeom_splits_cache_bounded():
+    icepool.math.clear_caches()
+    for draws in range(icepool.math.HYPERGEOM_CACHE_SIZE + 10):
+        icepool.math.hypergeom_splits((draws, ), draws)
+    info = icepool.math.hypergeom_splits.cache_info()
+    assert info.currsize == icepool.math.HYPERGEOM_CACHE_SIZE
+
+
+def test_deal_splits():
+    hand_sizes = (2, 1, 3)
+    result = icepool.math.deal_splits(hand_sizes, 4, 1)
+    expected = []
+    for total in range(1, 5):
+        for counts, weight in icepool.math.hypergeom_splits(hand_sizes, total):
+            expected.append((counts, math.comb(4, total) * weight))
+    assert result == tuple(expected)
+
+
+def test_deal_splits_weights():
+    result = dict(icepool.math.deal_splits((2, 2), 2, 0))
+    for counts, weight in result.items():
+        assert weight == math.comb(2, sum(counts)) * icepool.math.multinomial(
+            *counts)
+    assert result[1, 1] == 2
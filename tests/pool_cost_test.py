@@ -51,3 +51,44 @@ def test_pool_skip_max_but_truncate():
     pool = icepool.Pool([d6, d6, d8])[1, 1, 0]
     pop_min_cost, pop_max_cost = icepool.pool_cost.estimate_costs(pool)
     assert pop_min_cost > pop_max_cost
+
+
+def deal_transitions(deal):
+    """Brute-force count of transitions when popping from the min side."""
+    result = 0
+    frontier = {deal}
+    while frontier:
+        next_frontier = set()
+        for d in frontier:
+            if not d.outcomes():
+                continue
+            for popped, _, _ in d._generate_min(d.min_outcome()):
+                result += 1
+                next_frontier.add(popped)
+        frontier = next_frontier
+    return result
+
+
+@pytest.mark.parametrize('deck,hand_sizes', [
+    (icepool.Deck({0: 8, 1: 1, 2: 1, 3: 1, 4: 1, 5: 3}), (2, 3)),
+    (icepool.Deck(range(6), times=3), (2, 2, 1)),
+    (icepool.Deck({0: 1, 1: 5, 2: 2, 3: 1}), (1, 2, 3)),
+])
+def test_deal_cost(deck, hand_sizes):
+    deal = deck.deal(*hand_sizes)
+    pop_min_cost, pop_max_cost = deal._estimate_order_costs()
+    assert pop_min_cost == pop_max_cost == deal_transitions(deal)
+
+
+def test_deal_pool_cost():
+    deal = icepool.Deck({0: 10, 1: 1, 2: 1, 3: 1}).deal(3)
+    pool = icepool.Pool([d8, d12, d6])
+    pop_min_cost, pop_max_cost = icepool.sum_evaluator._estimate_order_costs(
+        deal, pool)
+    assert pop_min_cost > pop_max_cost
+
+
+def test_deal_sample_skips_cost():
+    deal = icepool.Deck(range(13), times=4).deal(5, 5)
+    deal.sample()
+    assert '_transition_count' not in deal.__dict__
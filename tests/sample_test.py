@@ -1,4 +1,5 @@
 import icepool
+import pytest
 
 
 def test_die_sample():
@@ -22,3 +23,91 @@ def test_deal_sample():
     a, b = icepool.Deck({'A': 1, 'B': 2, 'C': 3}).deal(3, 2).sample()
     assert all(x in ['A', 'B', 'C'] for x in a)
     assert all(x in ['A', 'B', 'C'] for x in b)
+
+
+def test_pool_sample_many():
+    pytest.importorskip('numpy')
+    pool = icepool.standard_pool([6, 6, 6, 8])[:-1]
+    result = pool.sample_many(1000, rng=0)
+    assert sum(result.values()) == 1000
+    for (sample,) in result:
+        assert len(sample) == 3
+        assert all(1 <= x <= 8 for x in sample)
+        assert tuple(sorted(sample)) == sample
+
+
+def test_pool_sample_many_seeded():
+    pytest.importorskip('numpy')
+    pool = icepool.d6.pool(4)
+    assert pool.sample_many(100, rng=1) == pool.sample_many(100, rng=1)
+
+
+def test_deal_sample_many():
+    pytest.importorskip('numpy')
+    deal = icepool.Deck({'A': 1, 'B': 2, 'C': 3}).deal(3, 2)
+    result = deal.sample_many(100, rng=0)
+    assert sum(result.values()) == 100
+    for a, b in result:
+        assert len(a) == 3
+        assert len(b) == 2
+
+
+def test_deal_sample_many_multiset():
+    pytest.importorskip('numpy')
+    deck = icepool.Deck({'A': 1, 'B': 2, 'C': 3})
+    result = deck.deal(2, 1, 3).sample_many(100, rng=0)
+    for hands in result:
+        assert sorted(sum(hands, start=())) == ['A', 'B', 'B', 'C', 'C', 'C']
+        assert all(hand == tuple(sorted(hand)) for hand in hands)
+
+
+def test_deal_sample_array():
+    pytest.importorskip('numpy')
+    deal = icepool.Deck(range(13), times=4).deal(5, 2)
+    a, b = deal.sample_array(1000, rng=0)
+    assert a.shape == (1000, 5)
+    assert b.shape == (1000, 2)
+    assert (a[:, 1:] >= a[:, :-1]).all()
+    assert (a.min(), a.max()) == (0, 12)
+
+
+def test_evaluator_sample_many():
+    pytest.importorskip('numpy')
+    pool = icepool.d6.pool(3)
+    result = icepool.sum_evaluator.sample_many(pool, n=10000, rng=0)
+    assert result.denominator() == 10000
+    assert result.min_outcome() >= 3
+    assert result.max_outcome() <= 18
+    assert abs(result.mean() - 10.5) < 0.2
+
+
+def test_evaluator_estimate():
+    pytest.importorskip('numpy')
+    pool = icepool.d6.pool(3)
+    result, intervals = icepool.sum_evaluator.estimate(pool,
+                                                       samples=10000,
+                                                       rng=0)
+    assert result.denominator() == 10000
+    assert set(intervals.keys()) == set(result.outcomes())
+    for outcome, (low, high) in intervals.items():
+        assert 0.0 <= low <= result.probability(outcome) <= high <= 1.0
+
+
+def test_evaluate_max_cost_fallback():
+    pytest.importorskip('numpy')
+    pool = icepool.d6.pool(3)
+    result = icepool.sum_evaluator.evaluate(pool,
+                                            max_cost=1,
+                                            samples=100,
+                                            rng=0)
+    assert result.denominator() == 100
+    exact = icepool.sum_evaluator.evaluate(pool, max_cost=10**9)
+    assert exact.equals(pool.sum())
+
+
+def test_evaluate_samples_without_max_cost():
+    pool = icepool.d6.pool(3)
+    with pytest.raises(ValueError):
+        icepool.sum_evaluator.evaluate(pool, samples=100)
+    with pytest.raises(ValueError):
+        icepool.sum_evaluator.evaluate(pool, rng=0)
@@ -1,4 +1,6 @@
 import icepool
+import math
+from fractions import Fraction
 import pytest
 
 
@@ -39,3 +41,154 @@ def test_min_quantile():
 def test_max_quantile():
     assert icepool.d6.quantile_left(100) == 6
     assert icepool.d6.quantile_right(100) == 6
+
+
+def naive_central_moment(die, k):
+    mean = sum(outcome * p for outcome, p in zip(die, die.probabilities()))
+    return sum(p * (outcome - mean)**k
+               for outcome, p in zip(die, die.probabilities()))
+
+
+@pytest.mark.parametrize(
+    'die', [icepool.d6, 3 @ icepool.d6,
+            icepool.d20.explode(depth=1) - 10,
+            icepool.Die([0.5, 1.5, 4.0])])
+def test_summary(die):
+    m2 = naive_central_moment(die, 2)
+    expected = {
+        'mean': pytest.approx(sum(x * p for x, p in zip(die, die.probabilities()))),
+        'variance': pytest.approx(m2),
+        'standard_deviation': pytest.approx(m2**0.5),
+        'skewness': pytest.approx(naive_central_moment(die, 3) / m2**1.5),
+        'excess_kurtosis':
+        pytest.approx(naive_central_moment(die, 4) / m2**2 - 3.0),
+    }
+    assert die.summary() == expected
+    assert die.skewness() == die.summary()['skewness']
+
+
+def test_summary_zero_variance():
+    result = icepool.Die([5]).summary()
+    assert result['variance'] == 0.0
+    assert math.isnan(result['skewness'])
+
+
+def test_variance_skips_higher_power_sums():
+    die = 3 @ icepool.d6
+    die.mean()
+    die.variance()
+    assert '_higher_power_sums' not in die.__dict__
+    die.skewness()
+    assert '_higher_power_sums' in die.__dict__
+
+
+def test_variance_large_offset():
+    # Exact integer moments don't suffer from cancellation.
+    assert (icepool.d6 + 10**12).variance() == icepool.d6.variance()
+
+
+def test_covariance_matrix():
+    die = icepool.Die([(1, 2, 3), (2, 4, 1), (3, 6, 2)])
+    matrix = die.covariance_matrix()
+    for i in range(3):
+        for j in range(3):
+            mean_i = die.marginals[i].mean()
+            mean_j = die.marginals[j].mean()
+            expected = sum((outcome[i] - mean_i) * (outcome[j] - mean_j) * p
+                           for outcome, p in zip(die, die.probabilities()))
+            assert matrix[i][j] == pytest.approx(expected)
+            assert die.covariance(i, j) == matrix[i][j]
+    assert die.correlation(0, 1) == pytest.approx(1.0)
+
+
+def test_exact_mean_variance():
+    die = icepool.d6
+    assert die.mean(exact=True) == Fraction(7, 2)
+    assert die.variance(exact=True) == Fraction(35, 12)
+    assert isinstance(die.mean(exact=True), Fraction)
+
+
+def test_exact_mean_fraction_outcomes():
+    die = icepool.Die([Fraction(1, 3), Fraction(1, 2)])
+    assert die.mean(exact=True) == Fraction(5, 12)
+    assert die.variance(exact=True) == Fraction(1, 144)
+
+
+def test_exact_float_outcomes():
+    with pytest.raises(TypeError):
+        icepool.Die([0.5, 1.5]).mean(exact=True)
+
+
+def test_exact_keep_highest():
+    die = icepool.d20.keep_highest(30, 1)
+    expected = sum(
+        Fraction(outcome * quantity, die.denominator())
+        for outcome, quantity in die.items())
+    assert die.mean(exact=True) == expected
+
+
+def test_exact_probabilities():
+    die = 2 @ icepool.d6
+    assert die.probability(7, exact=True) == Fraction(1, 6)
+    assert die.probabilities(exact=True)[0] == Fraction(1, 36)
+    assert die.probabilities_le(exact=True)[-1] == 1
+    assert die.probabilities_ge(exact=True, percent=True)[0] == 100
+    assert die.probabilities_ge_at([7], exact=True) == (Fraction(7, 12), )
+    assert all(
+        isinstance(x, Fraction) for x in die.probabilities_le(exact=True))
+
+
+def test_exact_covariance():
+    die = icepool.Die([(1, 2), (2, 5), (3, 5)])
+    assert die.covariance(0, 1, exact=True) == Fraction(1)
+    assert die.covariance_matrix(exact=True)[1][1] == Fraction(2)
+
+
+def test_quantiles():
+    die = 3 @ icepool.d6 + icepool.Die([0, 0, 1])
+    ns = [50, 0, 99, 100, 1, 25, 75, 50]
+    assert die.quantiles_left(ns) == tuple(die.quantile_left(n) for n in ns)
+    assert die.quantiles_right(ns) == tuple(die.quantile_right(n) for n in ns)
+    assert die.quantiles(ns) == tuple(die.quantile(n) for n in ns)
+
+
+def test_quantiles_denominator():
+    assert icepool.d6.quantiles_left([1, 2, 3], 3) == (2, 4, 6)
+    assert icepool.d6.quantiles_right([0, 1, 2], 2) == (1, 4, 6)
+
+
+def test_probabilities_percent_cached():
+    die = 2 @ icepool.d6
+    assert die.probabilities(percent=True) is die.probabilities(percent=True)
+    assert die.probabilities_le(percent=True)[-1] == pytest.approx(100.0)
+
+
+@pytest.mark.parametrize('percent', [False, True])
+def test_probabilities_array(percent):
+    pytest.importorskip('numpy')
+    die = 3 @ icepool.d6
+    for array, expected in [
+        (die.probabilities_array(percent), die.probabilities(percent)),
+        (die.probabilities_le_array(percent), die.probabilities_le(percent)),
+        (die.probabilities_ge_array(percent), die.probabilities_ge(percent)),
+    ]:
+        assert array.tolist() == pytest.approx(expected)
+        assert not array.flags.writeable
+    assert die.probabilities_array(percent) is die.probabilities_array(
+        percent)
+
+
+def test_probabilities_array_correctly_rounded():
+    pytest.importorskip('numpy')
+    # The denominator is beyond 2**53 but within int64.
+    die = icepool.Die({0: 182076244213740021, 1: 888599})
+    assert 2**53 < die.denominator() < 2**63
+    assert die.probabilities_array().tolist() == list(die.probabilities())
+
+
+def test_probabilities_array_huge_denominator():
+    pytest.importorskip('numpy')
+    die = icepool.d20.keep_highest(300, 1)
+    assert die.denominator() > 2**1100
+    assert die.probabilities_array().tolist() == list(die.probabilities())
+    assert die.probabilities_le_array()[-1] == 1.0
@@ -115,4 +115,16 @@ def test_count():
 def test_count_in():
     result = icepool.d6.count_in(2, {2, 4})
     expected = 2 @ icepool.coin(2, 6)
-    assert result.equals(expected)
\ No newline at end of file
+    assert result.equals(expected)
+
+
+def test_sub_memoize_repeat():
+    calls = []
+
+    def repl(x):
+        calls.append(x)
+        return icepool.d6 + x if x < 20 else x
+
+    result = icepool.d6.sub(repl, repeat=3, memoize=True)
+    assert len(calls) == len(set(calls))
+    assert result.equals(icepool.d6.sub(repl, repeat=3))
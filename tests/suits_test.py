@@ -0,0 +1,76 @@
+import icepool
+import pytest
+
+
+class SuitTotals(icepool.OutcomeCountEvaluator):
+    """Totals the per-suit counts over all faces, for each hand."""
+
+    def next_state(self, state, face, *suit_counts):
+        if state is None:
+            return suit_counts
+        return tuple(
+            tuple(a + b
+                  for a, b in zip(x, y))
+            for x, y in zip(state, suit_counts))
+
+    def order(self, *generators):
+        return icepool.Order.Any
+
+
+class CardSuitTotals(icepool.OutcomeCountEvaluator):
+    """Equivalent to `SuitTotals` on the underlying (face, suit) generator."""
+
+    def __init__(self, suits):
+        self._suits = suits
+
+    def next_state(self, state, card, *counts):
+        if state is None:
+            state = ((0, ) * len(self._suits), ) * len(counts)
+        i = self._suits.index(card[1])
+        return tuple(x[:i] + (x[i] + c, ) + x[i + 1:]
+                     for x, c in zip(state, counts))
+
+    def order(self, *generators):
+        return icepool.Order.Any
+
+
+deck = icepool.Deck([(face, suit) for face in range(5) for suit in 'cdhs'])
+
+
+def test_suits_order():
+    generator = icepool.SuitGenerator(deck.deal(2))
+    assert generator.suits() == ('c', 'd', 'h', 's')
+
+
+def test_flush():
+    generator = icepool.SuitGenerator(
+        icepool.Deck([(face, suit) for face in range(13)
+                      for suit in 'cdhs']).deal(5))
+    result = SuitTotals().evaluate(generator).sub(lambda x: max(x[0]))
+    assert result.probability(5) == pytest.approx(5148 / 2598960)
+
+
+@pytest.mark.parametrize('hand_sizes', [(3, ), (2, 2), (1, 2, 1)])
+def test_suits_deal(hand_sizes):
+    deal = deck.deal(*hand_sizes)
+    result = SuitTotals().evaluate(icepool.SuitGenerator(deal))
+    expected = CardSuitTotals(('c', 'd', 'h', 's')).evaluate(deal)
+    assert result.equals(expected)
+
+
+def test_suits_pool():
+    die = icepool.Die([(face, suit) for face in range(3) for suit in 'ab'])
+    pool = die.pool(3)
+    result = SuitTotals().evaluate(icepool.SuitGenerator(pool))
+    expected = CardSuitTotals(('a', 'b')).evaluate(pool)
+    assert result.equals(expected)
+
+
+def test_suits_unorderable():
+    # The suits 'x' and 1 can't be compared, but the cards never tie on face.
+    deck = icepool.Deck([(0, 'x'), (1, 1), (2, 'x')])
+    generator = icepool.SuitGenerator(deck.deal(2))
+    assert generator.suits() == ('x', 1)
+    result = SuitTotals().evaluate(generator)
+    expected = CardSuitTotals(['x', 1]).evaluate(deck.deal(2))
+    assert result.equals(expected)
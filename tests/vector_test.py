@@ -1,4 +1,8 @@
 import icepool
+import icepool.die.die
+import icepool.elementwise
+import math
+import operator
 import pytest
 
 
@@ -103,3 +107,85 @@ def test_one_hot():
     result = 3 @ icepool.one_hot(6)
     expected = icepool.d6.pool(3).evaluate(OneHotEvaluator())
     assert result == expected
+
+
+def disable_vectorize(monkeypatch):
+    monkeypatch.setattr(icepool.die.die, 'VECTORIZE_MIN_SIZE', 10**18)
+    monkeypatch.setattr(icepool.elementwise, 'VECTORIZE_MIN_SIZE', 10**18)
+
+
+@pytest.mark.parametrize('op', [operator.add, operator.sub, operator.mul])
+def test_vectorized_binary_op(op, monkeypatch):
+    pytest.importorskip('numpy')
+    a = 4 @ icepool.one_hot(5)
+    b = icepool.Die([(x, -x, 2 * x, 0, x % 3) for x in range(-10, 10)])
+    result = a.binary_op(b, op)
+    disable_vectorize(monkeypatch)
+    expected = a.binary_op(b, op)
+    assert result.equals(expected)
+
+
+@pytest.mark.parametrize('op', [operator.neg, operator.pos, operator.abs])
+def test_vectorized_unary_op(op, monkeypatch):
+    pytest.importorskip('numpy')
+    die = icepool.Die([(x, -x, x * x) for x in range(-200, 200)])
+    result = die.unary_op(op)
+    disable_vectorize(monkeypatch)
+    expected = die.unary_op(op)
+    assert result.equals(expected)
+
+
+def test_vectorized_marginals(monkeypatch):
+    pytest.importorskip('numpy')
+    die = 6 @ icepool.one_hot(4)
+    bools = icepool.Die([(x % 2 == 0, x % 3 == 0) for x in range(300)])
+    results = [die.marginals[0], die.marginals[1:3], bools.marginals[1]]
+    disable_vectorize(monkeypatch)
+    expected = [die.marginals[0], die.marginals[1:3], bools.marginals[1]]
+    for r, e in zip(results, expected):
+        assert r.equals(e)
+    assert results[2].outcomes() == (False, True)
+    assert type(results[2].outcomes()[0]) is bool
+
+
+def test_vectorized_overflow_fallback():
+    pytest.importorskip('numpy')
+    big = 2**62
+    a = icepool.Die([(big + x, ) for x in range(20)])
+    result = a + a
+    assert result.max_outcome() == (2 * big + 38, )
+
+
+def test_vectorized_length_mismatch():
+    pytest.importorskip('numpy')
+    a = icepool.Die([(x, x) for x in range(20)])
+    b = icepool.Die([(x, x, x) for x in range(20)])
+    with pytest.raises(ValueError):
+        a + b
+
+
+@pytest.mark.parametrize('rolls', [0, 1, 2, 5])
+def test_multinomial_one_hot(rolls):
+    result = icepool.multinomial(icepool.d6, rolls)
+    expected = rolls @ icepool.one_hot(6)
+    assert result.equals(expected, simplify=True)
+
+
+def test_multinomial_weighted():
+    die = icepool.Die({'a': 1, 'b': 2, 'c': 3})
+    result = icepool.multinomial(die, 4)
+    expected = 4 @ icepool.Die({
+        (1, 0, 0): 1,
+        (0, 1, 0): 2,
+        (0, 0, 1): 3
+    })
+    assert result.equals(expected)
+
+
+def test_multinomial_large():
+    result = icepool.multinomial(icepool.d6, 30)
+    assert result.denominator() == 6**30
+    assert len(result) == math.comb(35, 5)
+    assert result.marginals[0].equals(
+        icepool.d6.sub(lambda x: x == 1).sub(int).pool(30).sum(),
+        simplify=True)